@@ -1,3 +1,5 @@
+from .converter import ConversionResult as ConversionResult
+from .converter import Converter as Converter
 from .python_wheel_to_conda_package import (
     python_wheel_to_conda_package as python_wheel_to_conda_package,
 )
@@ -1,28 +1,187 @@
-from argparse import ArgumentParser
+import json
+import os
+import sys
+from argparse import ArgumentParser, Namespace
+from collections.abc import Sequence
+from datetime import timedelta
 from pathlib import Path
 
-from . import python_wheel_to_conda_package
+from . import Converter, python_wheel_to_conda_package
+from ._worker import run_worker
 
+_FILTER_KEYS = ("exclude", "include")
+_WORKER_COMMAND = "worker"
 
-def main() -> None:
-    docstring = python_wheel_to_conda_package.__doc__
-    assert docstring
 
+def _parse_python_version(python_version: str, /) -> tuple[int, int]:
+    major, minor = python_version.split(".")
+    return int(major), int(minor)
+
+
+def _get_converter_parser() -> ArgumentParser:
+    parser = ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--compile-bytecode",
+        action="store_true",
+        help="Include the bytecode of the Python modules, compiled for the running Python, so that conda does not compile them at install time.",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        help="Glob pattern of the Wheel files (e.g. `*/tests/*`) to leave out of the created packages. Can be repeated.",
+        metavar="PATTERN",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        help="Glob pattern of the Wheel files to keep in the created packages. Can be repeated. If not passed, all the files not excluded are kept.",
+        metavar="PATTERN",
+    )
+    parser.add_argument(
+        "--filter-file",
+        help=f"JSON file with {' and '.join(f'`{key}`' for key in _FILTER_KEYS)} lists of patterns, added to the ones passed as flags.",
+        type=Path,
+    )
+    parser.add_argument("--python-version", type=_parse_python_version)
+    return parser
+
+
+def _get_filter_patterns(args: Namespace, /) -> tuple[list[str], list[str]]:
+    filter_file: dict[str, object] = (
+        json.loads(args.filter_file.read_text()) if args.filter_file else {}
+    )
+
+    unexpected_keys = filter_file.keys() - set(_FILTER_KEYS)
+    if unexpected_keys:
+        raise ValueError(
+            f"Unexpected keys in `{args.filter_file}`: {sorted(unexpected_keys)}."
+        )
+
+    patterns: dict[str, list[str]] = {key: getattr(args, key) for key in _FILTER_KEYS}
+
+    for key, file_patterns in filter_file.items():
+        # A string would be spread into one-character patterns.
+        if not isinstance(file_patterns, list) or not all(
+            isinstance(pattern, str) for pattern in file_patterns
+        ):
+            raise ValueError(
+                f"Expected `{key}` in `{args.filter_file}` to be a list of patterns, got `{json.dumps(file_patterns)}`."
+            )
+        patterns[key] = [*patterns[key], *file_patterns]
+
+    return patterns["exclude"], patterns["include"]
+
+
+def _convert(arguments: Sequence[str], /, *, prog: str, description: str) -> None:
     parser = ArgumentParser(
-        prog=python_wheel_to_conda_package.__name__.replace("_", "-"),
-        description=docstring.splitlines()[0],
+        prog=prog, description=description, parents=[_get_converter_parser()]
+    )
+    parser.add_argument("wheel_paths", metavar="wheel_path", nargs="+", type=Path)
+    parser.add_argument(
+        "-o",
+        "--output-directory",
+        action="append",
+        help="Can be repeated to publish the created packages in several directories: they are written in the first one and cloned in the other ones.",
+        type=Path,
+    )
+    parser.add_argument(
+        "--explicit-lockfile",
+        help="Write an `@EXPLICIT` lockfile listing the created packages to this path.",
+        type=Path,
     )
-    parser.add_argument("wheel_path", type=Path)
-    parser.add_argument("-o", "--output-directory", type=Path)
+    parser.add_argument(
+        "--manifest",
+        help="Write a JSON file listing the path, hashes, size, and `index.json` of the created packages to this path.",
+        type=Path,
+    )
+    parser.add_argument(
+        "--thread-count",
+        help="The number of Wheels to convert concurrently. Defaults to the number of CPUs on free-threaded Python builds and 1 otherwise.",
+        type=int,
+    )
+    parser.add_argument("--update-repodata-shards", action="store_true")
 
-    args = parser.parse_args()
+    args = parser.parse_args(arguments)
+    exclude, include = _get_filter_patterns(args)
 
-    conda_package_path = python_wheel_to_conda_package(
-        args.wheel_path,
+    results = Converter(
+        compile_bytecode=args.compile_bytecode,
+        compile_process_count=(os.cpu_count() or 0) if args.compile_bytecode else 0,
+        exclude=exclude,
+        include=include,
+        python_version=args.python_version,
+        update_repodata_shards=args.update_repodata_shards,
+    ).convert_many(
+        args.wheel_paths,
+        explicit_lockfile_path=args.explicit_lockfile,
+        manifest_path=args.manifest,
         output_directory=args.output_directory,
+        thread_count=args.thread_count,
+    )
+
+    for result in results:
+        for conda_package_path in [
+            result.conda_package_path,
+            *result.cloned_conda_package_paths,
+        ]:
+            print(conda_package_path.absolute())
+
+
+def _work(arguments: Sequence[str], /, *, prog: str) -> None:
+    parser = ArgumentParser(
+        prog=f"{prog} {_WORKER_COMMAND}",
+        description="Convert the Wheels dropped in the pending folder of a queue directory shared by several workers.",
+        parents=[_get_converter_parser()],
+    )
+    parser.add_argument("--queue", required=True, type=Path)
+    parser.add_argument(
+        "--exit-when-empty",
+        action="store_true",
+        help="Stop once there are no pending or claimed Wheels left.",
+    )
+    parser.add_argument(
+        "--lease-duration",
+        default=timedelta(minutes=5),
+        help="Seconds after which the claim of a worker that stopped renewing it can be stolen.",
+        type=lambda seconds: timedelta(seconds=float(seconds)),
+    )
+    parser.add_argument(
+        "--poll-interval",
+        default=timedelta(seconds=1),
+        help="Seconds to wait before checking for new Wheels when the queue is empty.",
+        type=lambda seconds: timedelta(seconds=float(seconds)),
     )
 
-    print(conda_package_path.absolute())
+    args = parser.parse_args(arguments)
+    exclude, include = _get_filter_patterns(args)
+
+    run_worker(
+        args.queue,
+        converter=Converter(
+            compile_bytecode=args.compile_bytecode,
+            exclude=exclude,
+            include=include,
+            python_version=args.python_version,
+        ),
+        exit_when_empty=args.exit_when_empty,
+        lease_duration=args.lease_duration,
+        poll_interval=args.poll_interval,
+    )
+
+
+def main() -> None:
+    docstring = python_wheel_to_conda_package.__doc__
+    assert docstring
+
+    prog = python_wheel_to_conda_package.__name__.replace("_", "-")
+    arguments = sys.argv[1:]
+
+    if arguments[:1] == [_WORKER_COMMAND]:
+        _work(arguments[1:], prog=prog)
+    else:
+        _convert(arguments, prog=prog, description=docstring.splitlines()[0])
 
 
 if __name__ == "__main__":
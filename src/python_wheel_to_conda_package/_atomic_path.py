@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from uuid import uuid4
+
+
+@contextmanager
+def atomic_path(path: Path, /) -> Generator[Path, None, None]:
+    # The file is written next to its final path and then renamed so that readers never see a partial file.
+    temporary_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+
+    try:
+        yield temporary_path
+        temporary_path.replace(path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from ._atomic_path import atomic_path
+
+if sys.platform == "linux":
+    import fcntl
+
+# See `linux/fs.h`, exposed as `fcntl.FICLONE` since Python 3.12.
+_FICLONE = 0x40049409
+
+
+def _reflink(source: Path, target: Path, /) -> bool:
+    if sys.platform != "linux":
+        return False
+
+    with source.open("rb") as source_file, target.open("xb") as target_file:
+        try:
+            fcntl.ioctl(
+                target_file.fileno(),
+                getattr(fcntl, "FICLONE", _FICLONE),
+                source_file.fileno(),
+            )
+        except OSError:
+            # The filesystem does not support reflinks or the paths are on different filesystems.
+            reflinked = False
+        else:
+            reflinked = True
+
+    if not reflinked:
+        target.unlink()
+
+    return reflinked
+
+
+def _hardlink(source: Path, target: Path, /) -> bool:
+    try:
+        os.link(source, target)
+    except OSError:
+        return False
+
+    return True
+
+
+def clone_file(source: Path, target: Path, /) -> None:
+    # Reflinks share the data blocks until one of the files is modified.
+    # Hardlinks share the file itself, which is fine since packages are never modified in place.
+    with atomic_path(target) as temporary_path:
+        if not _reflink(source, temporary_path) and not _hardlink(
+            source, temporary_path
+        ):
+            shutil.copyfile(source, temporary_path)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import importlib.util
+import marshal
+import multiprocessing
+import sys
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+
+# See https://peps.python.org/pep-0552/.
+_CHECKED_HASH_BASED_PYC_FLAGS = 0b11
+
+
+def _get_pyc_path(py_path: str, /) -> str:
+    directory, _, file_name = py_path.rpartition("/")
+    return f"{directory}/__pycache__/{file_name.removesuffix('.py')}.{sys.implementation.cache_tag}.pyc"
+
+
+def _compile(path_and_source: tuple[str, bytes], /) -> bytes | None:
+    path, source = path_and_source
+
+    try:
+        code = compile(source, path, "exec", dont_inherit=True, optimize=0)
+    except (SyntaxError, ValueError):
+        # Like `compileall`, leave the files that cannot be compiled (e.g. templates) without bytecode.
+        return None
+
+    # Hash-based pycs do not embed the modification time of the source so they are reproducible.
+    # They stay valid when conda sets a new modification time on the installed sources.
+    return b"".join(
+        [
+            importlib.util.MAGIC_NUMBER,
+            _CHECKED_HASH_BASED_PYC_FLAGS.to_bytes(4, "little"),
+            importlib.util.source_hash(source),
+            marshal.dumps(code),
+        ]
+    )
+
+
+def get_compile_executor(*, process_count: int) -> ProcessPoolExecutor:
+    # Compilation holds the GIL: processes are needed to use several cores.
+    # Spawned instead of forked since the calling process can have other threads (e.g. the ones of `Converter.convert_many`).
+    return ProcessPoolExecutor(
+        max_workers=process_count, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def compile_bytecode(
+    sources: Mapping[str, bytes],
+    /,
+    *,
+    executor: ProcessPoolExecutor | None,
+    process_count: int,
+) -> dict[str, bytes]:
+    items = list(sources.items())
+
+    if executor:
+        pycs = list(
+            executor.map(
+                _compile,
+                items,
+                chunksize=max(1, len(items) // (process_count * 4)),
+            )
+        )
+    else:
+        pycs = [_compile(item) for item in items]
+
+    return {
+        _get_pyc_path(path): pyc
+        for (path, _), pyc in zip(items, pycs, strict=True)
+        if pyc is not None
+    }
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import platform
+import re
+import sys
+from dataclasses import dataclass, replace
+
+from packaging.tags import Tag, parse_tag
+
+from ._wheel_dist_info import Wheel
+
+# See https://packaging.python.org/en/latest/specifications/platform-compatibility-tags/#platform-tag.
+_PLATFORM_TAG_PATTERN = re.compile(
+    r"^(?:(?P<linux>manylinux)(?:1|2010|2014|_\d+_\d+)_(?P<linux_architecture>.+)|macosx_\d+_\d+_(?P<macos_architecture>.+)|(?P<windows>win)(?:32|_(?P<windows_architecture>.+)))$"
+)
+
+_CONDA_ARCHITECTURES = {
+    # Conda's `(arch, subdir)` for each `(platform, Wheel architecture)`.
+    ("linux", "aarch64"): ("aarch64", "linux-aarch64"),
+    ("linux", "i686"): ("x86", "linux-32"),
+    ("linux", "ppc64le"): ("ppc64le", "linux-ppc64le"),
+    ("linux", "s390x"): ("s390x", "linux-s390x"),
+    ("linux", "x86_64"): ("x86_64", "linux-64"),
+    ("osx", "arm64"): ("arm64", "osx-arm64"),
+    ("osx", "x86_64"): ("x86_64", "osx-64"),
+    ("win", "amd64"): ("x86_64", "win-64"),
+    ("win", "arm64"): ("arm64", "win-arm64"),
+    ("win", None): ("x86", "win-32"),
+}
+
+_CONDA_PLATFORMS = {"darwin": "osx", "linux": "linux", "win32": "win"}
+
+_CPYTHON_INTERPRETER_PATTERN = re.compile(r"^cp3(?P<minor>\d+)$")
+
+
+def _get_platform_and_architecture(platform_tag: str, /) -> tuple[str, str | None]:
+    match = _PLATFORM_TAG_PATTERN.match(platform_tag)
+
+    if match:
+        if match.group("linux"):
+            return "linux", match.group("linux_architecture")
+        if match.group("windows"):
+            return "win", match.group("windows_architecture")
+        return "osx", match.group("macos_architecture")
+
+    raise ValueError(f"Unsupported platform tag `{platform_tag}`.")
+
+
+def _get_python_minor_version(
+    tag: Tag, /, *, python_version: tuple[int, int] | None
+) -> int:
+    interpreter_match = _CPYTHON_INTERPRETER_PATTERN.match(tag.interpreter)
+
+    if not interpreter_match:
+        raise ValueError(f"Unsupported interpreter tag `{tag.interpreter}`.")
+
+    minor = int(interpreter_match.group("minor"))
+
+    if tag.abi == tag.interpreter:
+        if python_version and python_version != (3, minor):
+            raise ValueError(
+                f"Cannot target Python {'.'.join(map(str, python_version))} with a Wheel built for Python 3.{minor}."
+            )
+
+        return minor
+
+    if tag.abi != "abi3":
+        raise ValueError(f"Unsupported ABI tag `{tag.abi}`.")
+
+    if not python_version:
+        raise ValueError(
+            f"The targeted Python version must be specified to convert a Wheel with the `{tag.abi}` ABI tag."
+        )
+
+    if python_version[0] != 3 or python_version[1] < minor:  # noqa: PLR2004
+        raise ValueError(
+            f"Cannot target Python {'.'.join(map(str, python_version))} with a Wheel requiring Python 3.{minor} or later."
+        )
+
+    return python_version[1]
+
+
+@dataclass(frozen=True, kw_only=True)
+class CondaTarget:
+    """Where and for which Python the Conda package will be installed."""
+
+    architecture: str | None = None
+    platform: str | None = None
+    python_version: tuple[int, int] | None = None
+    """``None`` for ``noarch: python`` packages."""
+
+    subdir: str = "noarch"
+
+    @classmethod
+    def from_wheel(
+        cls, wheel: Wheel, /, *, python_version: tuple[int, int] | None = None
+    ) -> CondaTarget:
+        tags = {tag for _tag in wheel.tags for tag in parse_tag(_tag)}
+
+        if all(tag.abi == "none" and tag.platform == "any" for tag in tags) and any(
+            tag.interpreter.startswith("py3") for tag in tags
+        ):
+            return cls()
+
+        targets = {
+            (
+                _get_platform_and_architecture(tag.platform),
+                _get_python_minor_version(tag, python_version=python_version),
+            )
+            for tag in tags
+        }
+
+        if len(targets) != 1:
+            raise ValueError(
+                f"Expected the tags to all target the same platform and Python version but got {sorted(wheel.tags)}."
+            )
+
+        ((platform_and_architecture, minor),) = targets
+
+        if platform_and_architecture not in _CONDA_ARCHITECTURES:
+            raise ValueError(
+                f"Unsupported platform and architecture: {platform_and_architecture}."
+            )
+
+        architecture, subdir = _CONDA_ARCHITECTURES[platform_and_architecture]
+
+        return cls(
+            architecture=architecture,
+            platform=platform_and_architecture[0],
+            python_version=(3, minor),
+            subdir=subdir,
+        )
+
+    def for_bytecode(
+        self, *, python_version: tuple[int, int] | None = None
+    ) -> CondaTarget:
+        # Bytecode can only be compiled for the running interpreter.
+        running_python_version = sys.version_info[:2]
+        target_python_version = (
+            self.python_version or python_version or running_python_version
+        )
+
+        if (
+            sys.implementation.name != "cpython"
+            or target_python_version != running_python_version
+        ):
+            raise ValueError(
+                f"Cannot compile bytecode for CPython {'.'.join(map(str, target_python_version))} with {sys.implementation.name} {'.'.join(map(str, running_python_version))}."
+            )
+
+        if self.python_version:
+            return self
+
+        # Without `noarch: python`, the site-packages path depends on the platform: target the running one.
+        platform_and_architecture = (
+            _CONDA_PLATFORMS.get(sys.platform, sys.platform),
+            platform.machine().lower(),
+        )
+
+        if platform_and_architecture not in _CONDA_ARCHITECTURES:
+            raise ValueError(
+                f"Unsupported platform and architecture: {platform_and_architecture}."
+            )
+
+        architecture, subdir = _CONDA_ARCHITECTURES[platform_and_architecture]
+
+        return replace(
+            self,
+            architecture=architecture,
+            platform=platform_and_architecture[0],
+            python_version=running_python_version,
+            subdir=subdir,
+        )
+
+    @property
+    def python_version_nodot(self) -> str | None:
+        return "".join(map(str, self.python_version)) if self.python_version else None
+
+    @property
+    def site_packages_path(self) -> str:
+        if not self.python_version:
+            # Conda moves it to the site-packages of the installed Python when linking the package.
+            return "site-packages"
+
+        if self.platform == "win":
+            return "Lib/site-packages"
+
+        return f"lib/python{'.'.join(map(str, self.python_version))}/site-packages"
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable
+from fnmatch import fnmatchcase
+
+from ._wheel_dist_info import RecordItem
+
+_DIST_INFO_FOLDER_SUFFIX = ".dist-info"
+
+
+def _matches(file_path: str, patterns: Iterable[str], /) -> bool:
+    return any(fnmatchcase(file_path, pattern) for pattern in patterns)
+
+
+def filter_record_items(
+    record_items: Iterable[RecordItem],
+    /,
+    *,
+    exclude: Collection[str],
+    include: Collection[str],
+) -> tuple[list[RecordItem], list[RecordItem]]:
+    kept_record_items: list[RecordItem] = []
+    dropped_record_items: list[RecordItem] = []
+
+    for record_item in record_items:
+        file_path = record_item.file_path
+        is_kept = (not include or _matches(file_path, include)) and not _matches(
+            file_path, exclude
+        )
+        # The metadata is needed by tools such as pip to see the distribution as installed.
+        if is_kept or file_path.partition("/")[0].endswith(_DIST_INFO_FOLDER_SUFFIX):
+            kept_record_items.append(record_item)
+        else:
+            dropped_record_items.append(record_item)
+
+    return kept_record_items, dropped_record_items
@@ -1,22 +1,24 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
-from collections.abc import Collection
+from collections.abc import Callable, Collection, Mapping
 from typing import Any
 
-from ._get_conda_package_match_specification import (
-    get_conda_package_match_specification,
-)
+from ._conda_target import CondaTarget
+from ._get_conda_package_match_specification import CondaPackageMatchSpecification
 from ._get_wheel_path_to_conda_path import get_wheel_path_to_conda_path
 from ._wheel_dist_info import RecordItem, WheelDistInfo
 
 _JSON_INDENT = 2
 
 
-def _get_build_number_and_string(build_tag: str | None, /) -> tuple[int, str]:
+def _get_build_number_and_string(
+    build_tag: str | None, /, *, python_version_nodot: str | None
+) -> tuple[int, str]:
     build_number: int = 0
-    build_string: str = "py_0"
+    build_string: str = f"py{python_version_nodot or ''}_0"
 
     if build_tag:
         match = re.match(
@@ -30,6 +32,10 @@ def _get_build_number_and_string(build_tag: str | None, /) -> tuple[int, str]:
         else:
             build_string = build_tag
 
+        if python_version_nodot:
+            # Packages of the same version built for different Python versions must have different file names.
+            build_string = f"py{python_version_nodot}_{build_string}"
+
     forbidden_character = "-"
     if forbidden_character in build_string:
         # See https://docs.conda.io/projects/conda-build/en/latest/resources/define-metadata.html#build-number-and-string.
@@ -40,13 +46,18 @@ def _get_build_number_and_string(build_tag: str | None, /) -> tuple[int, str]:
     return build_number, build_string
 
 
-def _get_index_json(
+def get_index(
     *,
+    conda_target: CondaTarget,
+    get_conda_package_match_specification: Callable[
+        [str], CondaPackageMatchSpecification | None
+    ],
     timestamp: int,
     wheel_dist_info: WheelDistInfo,
-) -> str:
+) -> dict[str, Any]:
     build_number, build_string = _get_build_number_and_string(
-        wheel_dist_info.wheel.build_tag
+        wheel_dist_info.wheel.build_tag,
+        python_version_nodot=conda_target.python_version_nodot,
     )
 
     requirements: dict[str, str] = {}
@@ -63,8 +74,16 @@ def _get_index_json(
                 conda_package_match_specification.version
             )
 
-    index: dict[str, Any] = {
-        "arch": None,
+    if conda_target.python_version:
+        major, minor = conda_target.python_version
+        # Same pinning as conda-forge packages built for a specific Python version.
+        requirements["python"] = f">={major}.{minor},<{major}.{minor + 1}.0a0"
+        requirements["python_abi"] = (
+            f"{major}.{minor}.* *_cp{conda_target.python_version_nodot}"
+        )
+
+    return {
+        "arch": conda_target.architecture,
         "build": build_string,
         "build_number": build_number,
         "depends": [
@@ -72,33 +91,44 @@ def _get_index_json(
             for package_name, version_specification in requirements.items()
         ],
         "name": wheel_dist_info.metadata.package_name,
-        "noarch": "python",
-        "platform": None,
-        "subdir": "noarch",
+        **({} if conda_target.python_version else {"noarch": "python"}),
+        "platform": conda_target.platform,
+        "subdir": conda_target.subdir,
         "timestamp": timestamp,
         "version": wheel_dist_info.metadata.version,
     }
 
-    return json.dumps(index, indent=_JSON_INDENT)
-
 
 def _get_paths_json(
     record_items: Collection[RecordItem],
     /,
     *,
-    data_folder_name: str | None = None,
+    bytecode: Mapping[str, bytes],
+    conda_target: CondaTarget,
+    data_folder_names: Mapping[str, str],
 ) -> str:
     paths: dict[str, Any] = {
         "paths": [
             {
                 "_path": get_wheel_path_to_conda_path(
-                    record_item.file_path, data_folder_name=data_folder_name
+                    record_item.file_path,
+                    conda_target=conda_target,
+                    data_folder_names=data_folder_names,
                 ),
                 "path_type": "hardlink",
                 "sha256": record_item.sha256,
                 "size_in_bytes": record_item.size_in_bytes,
             }
             for record_item in record_items
+        ]
+        + [
+            {
+                "_path": pyc_path,
+                "path_type": "hardlink",
+                "sha256": hashlib.sha256(pyc).hexdigest(),
+                "size_in_bytes": len(pyc),
+            }
+            for pyc_path, pyc in bytecode.items()
         ],
         "paths_version": 1,
     }
@@ -108,20 +138,25 @@ def _get_paths_json(
 
 def get_conda_info_files(
     *,
-    data_folder_name: str | None = None,
-    timestamp: int,
+    bytecode: Mapping[str, bytes],
+    conda_target: CondaTarget,
+    data_folder_names: Mapping[str, str],
+    index: Mapping[str, Any],
     wheel_dist_info: WheelDistInfo,
 ) -> dict[str, str]:
-    return {
-        "index.json": _get_index_json(
-            timestamp=timestamp,
-            wheel_dist_info=wheel_dist_info,
-        ),
-        "link.json": json.dumps(
+    conda_info_files = {"index.json": json.dumps(index, indent=_JSON_INDENT)}
+
+    if not conda_target.python_version:
+        conda_info_files["link.json"] = json.dumps(
             {"noarch": {"type": "python"}, "package_metadata_version": 1},
             indent=_JSON_INDENT,
-        ),
-        "paths.json": _get_paths_json(
-            wheel_dist_info.record.items, data_folder_name=data_folder_name
-        ),
-    }
+        )
+
+    conda_info_files["paths.json"] = _get_paths_json(
+        wheel_dist_info.record.items,
+        bytecode=bytecode,
+        conda_target=conda_target,
+        data_folder_names=data_folder_names,
+    )
+
+    return conda_info_files
@@ -1,12 +1,37 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+
+from ._conda_target import CondaTarget
+
+_SITE_PACKAGES_DATA_KEYS = ("platlib", "purelib")
+
+
+def _get_data_folder_path(data_key: str, /, *, conda_target: CondaTarget) -> str:
+    match data_key:
+        case "data":
+            return ""
+        case "headers":
+            return "Include/" if conda_target.platform == "win" else "include/"
+        case "scripts":
+            if not conda_target.python_version:
+                # Conda moves them to `bin/` or `Scripts/`, depending on the platform, when linking the package.
+                return "python-scripts/"
+            return "Scripts/" if conda_target.platform == "win" else "bin/"
+        case _:
+            return f"{conda_target.site_packages_path}/"
+
 
 def get_wheel_path_to_conda_path(
-    file_path: str, /, *, data_folder_name: str | None
+    file_path: str,
+    /,
+    *,
+    conda_target: CondaTarget,
+    data_folder_names: Mapping[str, str],
 ) -> str:
-    data_prefix = f"{data_folder_name}/"
-    return (
-        file_path[len(data_prefix) :]
-        if data_folder_name and file_path.startswith(data_prefix)
-        else f"site-packages/{file_path}"
-    )
+    for data_key in ["data", "headers", "scripts", *_SITE_PACKAGES_DATA_KEYS]:
+        data_folder_name = data_folder_names.get(data_key)
+        if data_folder_name and file_path.startswith(f"{data_folder_name}/"):
+            return f"{_get_data_folder_path(data_key, conda_target=conda_target)}{file_path[len(data_folder_name) + 1 :]}"
+
+    return f"{conda_target.site_packages_path}/{file_path}"
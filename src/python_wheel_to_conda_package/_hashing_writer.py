@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import hashlib
+from typing import IO
+
+
+# Hashing the bytes as they are written avoids reading the created package back.
+class HashingWriter:
+    def __init__(self, file: IO[bytes], /) -> None:
+        self._file = file
+        self._md5 = hashlib.md5()  # noqa: S324
+        self._sha256 = hashlib.sha256()
+        self.size_in_bytes = 0
+
+    @property
+    def md5(self) -> str:
+        return self._md5.hexdigest()
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+    def write(self, data: bytes, /) -> int:
+        self._md5.update(data)
+        self._sha256.update(data)
+        self.size_in_bytes += len(data)
+        return self._file.write(data)
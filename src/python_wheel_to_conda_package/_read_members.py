@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import hashlib
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Sequence
+from concurrent.futures import Executor
+from functools import partial
+from zipfile import ZipFile, ZipInfo
+
+from ._read_zip_file import decompress_zip_file, read_compressed_zip_file
+from ._wheel_dist_info import RecordItem
+
+_BATCH_SIZE_IN_BYTES = 256 * 1024
+_STREAM_CHUNK_SIZE_IN_BYTES = 1024 * 1024
+# Larger members are streamed to not hold them entirely in memory.
+_STREAM_MIN_SIZE_IN_BYTES = 16 * 1024 * 1024
+
+_CompressedMember = tuple[RecordItem, ZipInfo, bytes]
+# The content of small members or the chunks of streamed ones.
+_Member = tuple[RecordItem, bytes | Iterable[bytes]]
+
+
+def _check_sha256(sha256: str, /, *, record_item: RecordItem) -> None:
+    if sha256 != record_item.sha256:
+        raise ValueError(
+            f"Expected `{record_item.file_path}` to have the sha256 `{record_item.sha256}` declared in the RECORD but got `{sha256}`."
+        )
+
+
+def _decompress_batch(
+    batch: Sequence[_CompressedMember], /, *, verify_hashes: bool
+) -> list[_Member]:
+    members: list[_Member] = []
+
+    for record_item, zip_info, compressed_content in batch:
+        content = decompress_zip_file(compressed_content, zip_info=zip_info)
+
+        if verify_hashes:
+            _check_sha256(hashlib.sha256(content).hexdigest(), record_item=record_item)
+
+        members.append((record_item, content))
+
+    return members
+
+
+def _stream_chunks(
+    zip_file: ZipFile,
+    zip_info: ZipInfo,
+    /,
+    *,
+    record_item: RecordItem,
+    verify_hash: bool,
+) -> Generator[bytes, None, None]:
+    sha256 = hashlib.sha256()
+
+    with zip_file.open(zip_info) as file:
+        while chunk := file.read(_STREAM_CHUNK_SIZE_IN_BYTES):
+            if verify_hash:
+                sha256.update(chunk)
+            yield chunk
+
+    if verify_hash:
+        _check_sha256(sha256.hexdigest(), record_item=record_item)
+
+
+def _stream_member(
+    zip_file: ZipFile,
+    zip_info: ZipInfo,
+    /,
+    *,
+    record_item: RecordItem,
+    verify_hash: bool,
+) -> list[_Member]:
+    return [
+        (
+            record_item,
+            _stream_chunks(
+                zip_file, zip_info, record_item=record_item, verify_hash=verify_hash
+            ),
+        )
+    ]
+
+
+def _group_members(
+    zip_file: ZipFile, read_plan: Iterable[RecordItem], /
+) -> Generator[list[_CompressedMember] | tuple[RecordItem, ZipInfo], None, None]:
+    # Decompressing members in batches keeps the scheduling overhead low for Wheels made of thousands of tiny modules.
+    batch: list[_CompressedMember] = []
+    batch_size = 0
+
+    for record_item in read_plan:
+        zip_info = zip_file.getinfo(record_item.file_path)
+        compressed_content = (
+            None
+            if zip_info.file_size > _STREAM_MIN_SIZE_IN_BYTES
+            else read_compressed_zip_file(zip_file, zip_info)
+        )
+
+        if compressed_content is None:
+            if batch:
+                yield batch
+                batch, batch_size = [], 0
+            yield record_item, zip_info
+            continue
+
+        batch.append((record_item, zip_info, compressed_content))
+        batch_size += len(compressed_content)
+
+        if batch_size >= _BATCH_SIZE_IN_BYTES:
+            yield batch
+            batch, batch_size = [], 0
+
+    if batch:
+        yield batch
+
+
+def read_members(
+    zip_file: ZipFile,
+    read_plan: Iterable[RecordItem],
+    /,
+    *,
+    executor: Executor | None,
+    read_ahead_size_in_bytes: int,
+    verify_hashes: bool,
+) -> Generator[_Member, None, None]:
+    # The compressed members are read on the calling thread, in the order of the plan.
+    # With an executor, they are decompressed and hashed on its threads while the caller consumes the previous members.
+    # zlib and hashlib release the GIL so this overlaps with the compression of the archive.
+    # The members are still yielded in the order of the plan so the created archive does not depend on the executor.
+    read_ahead_size_in_bytes = read_ahead_size_in_bytes if executor else 0
+    pending: deque[tuple[int, Callable[[], list[_Member]]]] = deque()
+    pending_size = 0
+
+    for group in _group_members(zip_file, read_plan):
+        size = (
+            sum(
+                len(compressed_content) + zip_info.file_size
+                for _, zip_info, compressed_content in group
+            )
+            if isinstance(group, list)
+            else 0
+        )
+
+        # The budget caps the compressed and decompressed bytes held by members not yielded yet.
+        while pending and pending_size + size > read_ahead_size_in_bytes:
+            pending_member_size, get_pending_members = pending.popleft()
+            pending_size -= pending_member_size
+            yield from get_pending_members()
+
+        if isinstance(group, list):
+            get_members: Callable[[], list[_Member]] = partial(
+                _decompress_batch, group, verify_hashes=verify_hashes
+            )
+            if executor:
+                get_members = executor.submit(get_members).result
+            pending.append((size, get_members))
+        else:
+            record_item, zip_info = group
+            pending.append(
+                (
+                    size,
+                    partial(
+                        _stream_member,
+                        zip_file,
+                        zip_info,
+                        record_item=record_item,
+                        verify_hash=verify_hashes,
+                    ),
+                )
+            )
+
+        pending_size += size
+
+    while pending:
+        yield from pending.popleft()[1]()
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Generator
+from contextlib import contextmanager
+from io import BufferedReader, BytesIO, FileIO
+from pathlib import Path
+from typing import IO
+
+from ._wheel_dist_info import RecordItem
+from ._wheel_layout import WheelLayout
+
+_READ_BUFFER_SIZE_IN_BYTES = 1024 * 1024
+_SLURP_MAX_SIZE_IN_BYTES = 32 * 1024 * 1024
+
+
+@contextmanager
+def open_wheel(wheel_path: Path, /) -> Generator[IO[bytes], None, None]:
+    with FileIO(wheel_path) as file:
+        if wheel_path.stat().st_size <= _SLURP_MAX_SIZE_IN_BYTES:
+            # A single sequential read is cheaper than many small ones, especially on network filesystems.
+            yield BytesIO(file.readall())
+        else:
+            # Reading members in the order given by `get_read_plan` makes most seeks land inside this buffer.
+            with BufferedReader(file, buffer_size=_READ_BUFFER_SIZE_IN_BYTES) as reader:
+                yield reader
+
+
+def get_read_plan(
+    record_items: Collection[RecordItem], /, *, wheel_layout: WheelLayout
+) -> list[RecordItem]:
+    # RECORD order often differs from the physical order of the members in the Wheel.
+    # Following the latter turns a random seek per member into a sequential read of the file.
+    # This order only depends on the Wheel so the created archive does not depend on how the Wheel is read.
+    return sorted(
+        record_items,
+        key=lambda record_item: (
+            wheel_layout.members[record_item.file_path].header_offset
+        ),
+    )
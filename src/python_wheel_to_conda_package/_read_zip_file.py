@@ -1,6 +1,67 @@
-from zipfile import ZipFile
+import os
+import struct
+import zlib
+from zipfile import (
+    ZIP_DEFLATED,
+    ZIP_STORED,
+    BadZipFile,
+    ZipFile,
+    ZipInfo,
+)
 
+_ENCRYPTED_FLAG = 0x1
+# See https://pkware.cachefly.net/webdocs/casestudies/APPNOTE.TXT section 4.3.7.
+_LOCAL_FILE_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_FILE_HEADER_SIGNATURE = b"PK\003\004"
+_RAW_DEFLATE_WINDOW_BITS = -zlib.MAX_WBITS
 
-def read_zip_file(zip_file: ZipFile, file_path: str, /) -> bytes:
-    with zip_file.open(file_path) as file:
-        return file.read()
+
+def read_compressed_zip_file(zip_file: ZipFile, zip_info: ZipInfo, /) -> bytes | None:
+    if (
+        zip_file.fp is None
+        or zip_info.flag_bits & _ENCRYPTED_FLAG
+        or zip_info.compress_type not in {ZIP_DEFLATED, ZIP_STORED}
+    ):
+        return None
+
+    # Reading the member in one go avoids the allocation of a `ZipExtFile` and its small chunked reads.
+    # This matters for Wheels made of thousands of tiny modules.
+    zip_file.fp.seek(zip_info.header_offset)
+    local_file_header = _LOCAL_FILE_HEADER.unpack(
+        zip_file.fp.read(_LOCAL_FILE_HEADER.size)
+    )
+
+    if local_file_header[0] != _LOCAL_FILE_HEADER_SIGNATURE:
+        raise BadZipFile(f"Bad magic number for `{zip_info.filename}`.")
+
+    zip_file.fp.seek(local_file_header[10] + local_file_header[11], os.SEEK_CUR)
+    return zip_file.fp.read(zip_info.compress_size)
+
+
+def decompress_zip_file(compressed_content: bytes, /, *, zip_info: ZipInfo) -> bytes:
+    # Does not touch the `ZipFile` so it can run on another thread.
+    content = (
+        zlib.decompress(
+            compressed_content, _RAW_DEFLATE_WINDOW_BITS, zip_info.file_size
+        )
+        if zip_info.compress_type == ZIP_DEFLATED
+        else compressed_content
+    )
+
+    if len(content) != zip_info.file_size or zlib.crc32(content) != zip_info.CRC:
+        raise BadZipFile(f"Bad CRC-32 for `{zip_info.filename}`.")
+
+    return content
+
+
+def read_zip_file(zip_file: ZipFile, file_path: str | ZipInfo, /) -> bytes:
+    zip_info = (
+        file_path if isinstance(file_path, ZipInfo) else zip_file.getinfo(file_path)
+    )
+    compressed_content = read_compressed_zip_file(zip_file, zip_info)
+
+    if compressed_content is None:
+        with zip_file.open(zip_info) as file:
+            return file.read()
+
+    return decompress_zip_file(compressed_content, zip_info=zip_info)
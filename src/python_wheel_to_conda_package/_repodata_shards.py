@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+from collections.abc import Generator, Mapping
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from ._atomic_path import atomic_path
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+# Same layout as https://github.com/conda/ceps/blob/main/cep-0016.md but with gzipped JSON instead of zstd-compressed msgpack to not require extra dependencies.
+_INDEX_FILENAME = "repodata_shards.json.gz"
+_LOCK_FILENAME = "repodata_shards.lock"
+_SHARDS_FOLDER_NAME = "shards"
+_SHARD_SUFFIX = ".json.gz"
+
+_LOCK_TIMEOUT = timedelta(minutes=1)
+_LOCK_POLL_INTERVAL = timedelta(milliseconds=10)
+
+
+def _try_lock(file_descriptor: int, /) -> bool:
+    try:
+        if sys.platform == "win32":
+            msvcrt.locking(file_descriptor, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(file_descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+
+    return True
+
+
+@contextmanager
+def _lock(path: Path, /) -> Generator[None, None, None]:
+    deadline = time.monotonic() + _LOCK_TIMEOUT.total_seconds()
+    # The file is never deleted: another process could otherwise lock a new file at the same path while the deleted one is still locked.
+    file_descriptor = os.open(path, os.O_CREAT | os.O_RDWR)
+
+    try:
+        # The operating system releases the lock when its holder exits, even if it crashed.
+        while not _try_lock(file_descriptor):
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"Could not acquire `{path}`: another conversion held it for more than {_LOCK_TIMEOUT}."
+                )
+            time.sleep(_LOCK_POLL_INTERVAL.total_seconds())
+
+        try:
+            yield
+        finally:
+            if sys.platform == "win32":
+                msvcrt.locking(file_descriptor, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(file_descriptor, fcntl.LOCK_UN)
+    finally:
+        os.close(file_descriptor)
+
+
+def _read(path: Path, /) -> Any:  # noqa: ANN401
+    return json.loads(gzip.decompress(path.read_bytes()))
+
+
+def _write_atomically(path: Path, content: bytes, /) -> None:
+    with atomic_path(path) as temporary_path:
+        temporary_path.write_bytes(content)
+
+
+def _encode(value: object, /) -> bytes:
+    # Sorted keys and a null `mtime` make the encoding reproducible and thus the shard names content-addressed.
+    return gzip.compress(
+        json.dumps(value, separators=(",", ":"), sort_keys=True).encode(), mtime=0
+    )
+
+
+def update_repodata_shards(
+    conda_package_path: Path, /, *, repodata_record: Mapping[str, Any]
+) -> None:
+    """Add the package to the shard of its name and point the shard index to the new shard.
+
+    The directory containing the package is the channel subdir.
+    The other shards are left untouched.
+    """
+    subdir_directory = conda_package_path.parent
+    shards_directory = subdir_directory / _SHARDS_FOLDER_NAME
+    shards_directory.mkdir(exist_ok=True)
+    index_path = subdir_directory / _INDEX_FILENAME
+    package_name: str = repodata_record["name"]
+
+    with _lock(subdir_directory / _LOCK_FILENAME):
+        shard_index: dict[str, Any] = (
+            _read(index_path)
+            if index_path.exists()
+            else {
+                "info": {
+                    "base_url": "",
+                    "shards_base_url": f"./{_SHARDS_FOLDER_NAME}/",
+                    "subdir": repodata_record["subdir"],
+                },
+                "shards": {},
+                "version": 1,
+            }
+        )
+
+        previous_shard_sha256: str | None = shard_index["shards"].get(package_name)
+        shard: dict[str, Any] = (
+            _read(shards_directory / f"{previous_shard_sha256}{_SHARD_SUFFIX}")
+            if previous_shard_sha256
+            else {"packages": {}, "packages.conda": {}, "removed": []}
+        )
+        shard["packages"][conda_package_path.name] = repodata_record
+
+        encoded_shard = _encode(shard)
+        shard_sha256 = hashlib.sha256(encoded_shard).hexdigest()
+        shard_path = shards_directory / f"{shard_sha256}{_SHARD_SUFFIX}"
+
+        # Shards are immutable: the previous one is kept for clients with a cached shard index.
+        if not shard_path.exists():
+            _write_atomically(shard_path, encoded_shard)
+
+        shard_index["shards"][package_name] = shard_sha256
+        _write_atomically(index_path, _encode(shard_index))
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import hashlib
+from base64 import urlsafe_b64encode
+from collections.abc import Collection, Mapping
+
+
+def _get_record_line(file_path: str, content: bytes, /) -> str:
+    # See https://packaging.python.org/en/latest/specifications/recording-installed-packages/#the-record-file.
+    digest = urlsafe_b64encode(hashlib.sha256(content).digest()).decode().rstrip("=")
+    return f"{file_path},sha256={digest},{len(content)}"
+
+
+def rewrite_record(
+    record: bytes,
+    /,
+    *,
+    dropped_file_paths: Collection[str],
+    rewritten_files: Mapping[str, bytes],
+) -> bytes:
+    lines: list[str] = []
+
+    for line in record.decode().rstrip().splitlines():
+        file_path = line.rsplit(",", 2)[0]
+
+        if file_path in dropped_file_paths:
+            continue
+
+        lines.append(
+            _get_record_line(file_path, rewritten_files[file_path])
+            if file_path in rewritten_files
+            else line
+        )
+
+    return "".join(f"{line}\n" for line in lines).encode()
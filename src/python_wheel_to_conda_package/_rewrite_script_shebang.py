@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+# Build backends write this shebang that installers replace with the path to the interpreter.
+# See https://packaging.python.org/en/latest/specifications/binary-distribution-format/#recommended-installer-features.
+_PYTHON_SHEBANG = b"#!python"
+
+
+def rewrite_script_shebang(script: bytes, /) -> bytes:
+    if not script.startswith(_PYTHON_SHEBANG):
+        return script
+
+    # The Python of the activated environment comes first in `PATH`.
+    return b"#!/usr/bin/env " + script[len(b"#!") :]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import tarfile
+from collections.abc import Iterable
+from typing import IO
+
+_BLOCK_SIZE = tarfile.BLOCKSIZE
+_FLUSH_THRESHOLD_IN_BYTES = 1024 * 1024
+_MAX_USTAR_NAME_LENGTH = 100
+_MAX_USTAR_SIZE = 8**11 - 1
+_NUL = b"\0"
+
+# The fields of a regular file header following the name, as written by `tarfile` with default `TarInfo` attributes.
+_UID_GID = b"0000000\0" * 2
+_MTIME = b"00000000000\0"
+_CHECKSUM_PLACEHOLDER = b" " * 8
+_TYPE_TO_PREFIX = (
+    tarfile.REGTYPE
+    + _NUL * 100  # Link name.
+    + tarfile.POSIX_MAGIC
+    + _NUL * 32  # User name.
+    + _NUL * 32  # Group name.
+    + _NUL * 8  # Device major number.
+    + _NUL * 8  # Device minor number.
+    + _NUL * 155  # Prefix.
+    + _NUL * 12  # Padding to the block size.
+)
+_CONSTANT_CHECKSUM = sum(_UID_GID + _MTIME + _CHECKSUM_PLACEHOLDER + _TYPE_TO_PREFIX)
+
+DEFAULT_MODE = tarfile.TarInfo().mode
+
+
+def _get_regular_file_header(name: str, size: int, /, *, mode: int) -> bytes:
+    if (
+        len(name) <= _MAX_USTAR_NAME_LENGTH
+        and name.isascii()
+        and size <= _MAX_USTAR_SIZE
+    ):
+        encoded_name = name.encode("ascii")
+        mode_field = b"%07o\0" % mode
+        size_field = b"%011o\0" % size
+        checksum = (
+            _CONSTANT_CHECKSUM + sum(encoded_name) + sum(mode_field) + sum(size_field)
+        )
+        return b"".join(
+            [
+                encoded_name,
+                _NUL * (_MAX_USTAR_NAME_LENGTH - len(encoded_name)),
+                mode_field,
+                _UID_GID,
+                size_field,
+                _MTIME,
+                b"%06o\0 " % checksum,
+                _TYPE_TO_PREFIX,
+            ]
+        )
+
+    # Let `tarfile` write the pax extended header needed for long or non-ASCII names and large sizes.
+    tar_info = tarfile.TarInfo(name)
+    tar_info.mode = mode
+    tar_info.size = size
+    return tar_info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+
+
+# Writes the same bytes as `tarfile` but without creating a `TarInfo` and a file object per member.
+# Headers and small members are coalesced so that the compressor receives a few large writes instead of several tiny ones per member.
+class TarWriter:
+    def __init__(self, file: IO[bytes], /) -> None:
+        self._buffer = bytearray()
+        self._file = file
+        self._size = 0
+
+    def _flush(self) -> None:
+        self._file.write(self._buffer)
+        self._size += len(self._buffer)
+        self._buffer.clear()
+
+    def _pad(self, size: int, /) -> None:
+        remainder = size % _BLOCK_SIZE
+        if remainder:
+            self._buffer += _NUL * (_BLOCK_SIZE - remainder)
+
+    def add(self, name: str, content: bytes, /, *, mode: int = DEFAULT_MODE) -> None:
+        self._buffer += _get_regular_file_header(name, len(content), mode=mode)
+        self._buffer += content
+        self._pad(len(content))
+
+        if len(self._buffer) >= _FLUSH_THRESHOLD_IN_BYTES:
+            self._flush()
+
+    def add_stream(
+        self,
+        name: str,
+        chunks: Iterable[bytes],
+        /,
+        *,
+        mode: int = DEFAULT_MODE,
+        size: int,
+    ) -> None:
+        self._buffer += _get_regular_file_header(name, size, mode=mode)
+        self._flush()
+
+        written_size = 0
+        for chunk in chunks:
+            self._file.write(chunk)
+            written_size += len(chunk)
+
+        if written_size != size:
+            raise OSError(f"Expected {size} bytes for `{name}` but got {written_size}.")
+
+        self._size += size
+        self._pad(size)
+
+    def close(self) -> None:
+        self._buffer += _NUL * (_BLOCK_SIZE * 2)
+        # Like `tarfile`, fill up the end with zero blocks.
+        self._buffer += _NUL * (-(self._size + len(self._buffer)) % tarfile.RECORDSIZE)
+        self._flush()
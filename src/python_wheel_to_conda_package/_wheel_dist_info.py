@@ -3,10 +3,15 @@ from __future__ import annotations
 import hashlib
 from base64 import urlsafe_b64decode
 from collections.abc import Mapping, Sequence
-from contextlib import suppress
 from dataclasses import dataclass
-from typing import ClassVar
+from io import TextIOWrapper
+from typing import IO, ClassVar
+from zipfile import ZipFile, ZipInfo
 
+from ._read_zip_file import read_zip_file
+from ._wheel_layout import WheelLayout
+
+_METADATA_FILENAME = "METADATA"
 _RECORD_FILENAME = "RECORD"
 _WHEEL_FILENAME = "WHEEL"
 
@@ -30,20 +35,7 @@ class Metadata:
     version: str
 
     @classmethod
-    def parse(cls, metadata: str, /) -> Metadata:
-        lines = metadata.splitlines()
-
-        empty_line_index = len(lines)
-
-        with suppress(
-            # No empty line which means there are no long description and all the lines follow the `name: value` format.
-            ValueError
-        ):
-            empty_line_index = lines.index("")
-
-        # Ignore the long description which is separated by the `key: value` lines by an empty line.
-        lines = lines[:empty_line_index]
-
+    def parse(cls, metadata: IO[bytes], /) -> Metadata:
         metadata_version: str | None = None
         package_name: str | None = None
         requires_dist: list[str] = []
@@ -52,20 +44,28 @@ class Metadata:
 
         metadata_version_key = "Metadata-Version"
 
-        for line in lines:
-            key, value = line.split(": ", maxsplit=1)
-
-            match key:
-                case key if key == metadata_version_key:
-                    metadata_version = _validate_metadata_version(value)
-                case "Name":
-                    package_name = value
-                case "Version":
-                    version = value
-                case "Requires-Python":
-                    requires_python = value
-                case "Requires-Dist":
-                    requires_dist.append(value)
+        with TextIOWrapper(metadata, encoding="utf-8") as lines:
+            for _line in lines:
+                line = _line.rstrip("\r\n")
+
+                if not line:
+                    # The long description is separated from the `key: value` lines by an empty line.
+                    # Stop there to avoid decoding it since it can be very large.
+                    break
+
+                key, value = line.split(": ", maxsplit=1)
+
+                match key:
+                    case key if key == metadata_version_key:
+                        metadata_version = _validate_metadata_version(value)
+                    case "Name":
+                        package_name = value
+                    case "Version":
+                        version = value
+                    case "Requires-Python":
+                        requires_python = value
+                    case "Requires-Dist":
+                        requires_dist.append(value)
 
         if not metadata_version:
             raise ValueError(f"Missing `{metadata_version_key}` metadata.")
@@ -160,25 +160,33 @@ class Record:
 @dataclass(frozen=True, kw_only=True)
 class Wheel:
     EXPECTED_ENTRIES: ClassVar[Mapping[str, str]] = {
-        "Root-Is-Purelib": "true",
-        "Tag": "py3-none-any",
         "Wheel-Version": "1.0",
     }
 
     _BUILD_KEY: ClassVar[str] = "Build"
     """See https://peps.python.org/pep-0427/#file-contents."""
 
+    _ROOT_IS_PURELIB_KEY: ClassVar[str] = "Root-Is-Purelib"
     _SEPARATOR: ClassVar[str] = ": "
+    _TAG_KEY: ClassVar[str] = "Tag"
 
     build_tag: str | None = None
+    root_is_purelib: bool = True
+    tags: Sequence[str] = ("py3-none-any",)
+    """There is one entry per expanded tag (e.g. ``py2-none-any`` and ``py3-none-any`` for ``py2.py3-none-any``)."""
 
     @classmethod
     def parse(cls, wheel: str, /) -> Wheel:
         entries: dict[str, str] = {}
+        tags: list[str] = []
 
         for line in wheel.splitlines():
             key, value = line.split(cls._SEPARATOR, maxsplit=1)
-            entries[key] = value
+
+            if key == cls._TAG_KEY:
+                tags.append(value)
+            else:
+                entries[key] = value
 
         for key, expected_value in cls.EXPECTED_ENTRIES.items():
             actual_value = entries.get(key)
@@ -188,20 +196,29 @@ class Wheel:
                     f"Expected `{key}` to be `{expected_value}` but got `{actual_value}`."
                 )
 
+        if not tags:
+            raise ValueError(f"Missing `{cls._TAG_KEY}`.")
+
         build_tag = entries.get(cls._BUILD_KEY)
 
-        return cls(build_tag=build_tag)
+        return cls(
+            build_tag=build_tag,
+            root_is_purelib=entries.get(cls._ROOT_IS_PURELIB_KEY) == "true",
+            tags=tags,
+        )
 
     def __str__(self) -> str:
-        entries: dict[str, str] = {}
+        entries: list[tuple[str, str]] = []
 
         if self.build_tag:
-            entries[self._BUILD_KEY] = self.build_tag
+            entries.append((self._BUILD_KEY, self.build_tag))
 
-        entries.update(self.EXPECTED_ENTRIES)
+        entries.append((self._ROOT_IS_PURELIB_KEY, str(self.root_is_purelib).lower()))
+        entries.extend((self._TAG_KEY, tag) for tag in self.tags)
+        entries.extend(self.EXPECTED_ENTRIES.items())
 
         return "\n".join(
-            [*[f"{key}{self._SEPARATOR}{value}" for key, value in entries.items()], ""]
+            [*[f"{key}{self._SEPARATOR}{value}" for key, value in entries], ""]
         )
 
 
@@ -212,14 +229,29 @@ class WheelDistInfo:
     wheel: Wheel
 
     @classmethod
-    def parse(
-        cls, dist_info_files: Mapping[str, bytes], /, *, dist_info_folder_name: str
-    ) -> WheelDistInfo:
+    def read(cls, zip_file: ZipFile, /, *, wheel_layout: WheelLayout) -> WheelDistInfo:
+        dist_info_folder_name = wheel_layout.dist_info_folder_name
+
+        def get_zip_info(file_name: str, /) -> ZipInfo:
+            file_path = f"{dist_info_folder_name}/{file_name}"
+            zip_info = wheel_layout.members.get(file_path)
+
+            if zip_info is None:
+                raise RuntimeError(f"Could not find `{file_path}`.")
+
+            return zip_info
+
+        # Only the files below are needed: the other ones (e.g. licenses or SBOMs) are not read.
+        with zip_file.open(get_zip_info(_METADATA_FILENAME)) as metadata:
+            parsed_metadata = Metadata.parse(metadata)
+
         return cls(
-            metadata=Metadata.parse(dist_info_files["METADATA"].decode()),
+            metadata=parsed_metadata,
             record=Record.parse(
-                dist_info_files[_RECORD_FILENAME],
+                read_zip_file(zip_file, get_zip_info(_RECORD_FILENAME)),
                 dist_info_folder_name=dist_info_folder_name,
             ),
-            wheel=Wheel.parse(dist_info_files[_WHEEL_FILENAME].decode().rstrip()),
+            wheel=Wheel.parse(
+                read_zip_file(zip_file, get_zip_info(_WHEEL_FILENAME)).decode().rstrip()
+            ),
         )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass
+from zipfile import ZipFile, ZipInfo
+
+_DATA_FOLDER_SUFFIX = ".data"
+_DIST_INFO_FOLDER_SUFFIX = ".dist-info"
+
+# See https://packaging.python.org/en/latest/specifications/binary-distribution-format/#file-contents.
+_TOP_LEVEL_FOLDER_NAME_PATTERN = re.compile(
+    r"^(?P<distribution_name>[^-]+)-(?P<version>([^.]+\.)+)(dist-info|data)$"
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class WheelLayout:
+    """Index of the members of a Wheel built in a single pass over its central directory."""
+
+    data_folder_names: Mapping[str, str]
+    """The ``{distribution}-{version}.data/{key}`` folder paths, by key (e.g. ``data`` or ``scripts``)."""
+
+    dist_info_folder_name: str
+
+    members: Mapping[str, ZipInfo]
+    """As with `ZipFile.getinfo`, the last member wins when a name is duplicated."""
+
+    @classmethod
+    def from_zip_file(cls, zip_file: ZipFile, /) -> WheelLayout:
+        data_folder_names: dict[str, str] = {}
+        dist_info_folder_name: str | None = None
+        members: dict[str, ZipInfo] = {}
+        is_top_level_folder_name_valid: dict[str, bool] = {}
+
+        for zip_info in zip_file.infolist():
+            file_path = zip_info.filename
+            members[file_path] = zip_info
+
+            top_level_folder_name, separator, relative_path = file_path.partition("/")
+
+            if not separator or not top_level_folder_name.endswith(
+                (_DATA_FOLDER_SUFFIX, _DIST_INFO_FOLDER_SUFFIX)
+            ):
+                continue
+
+            is_valid = is_top_level_folder_name_valid.get(top_level_folder_name)
+            if is_valid is None:
+                is_valid = bool(
+                    _TOP_LEVEL_FOLDER_NAME_PATTERN.match(top_level_folder_name)
+                )
+                is_top_level_folder_name_valid[top_level_folder_name] = is_valid
+
+            if not is_valid:
+                continue
+
+            if top_level_folder_name.endswith(_DIST_INFO_FOLDER_SUFFIX):
+                if dist_info_folder_name is None:
+                    dist_info_folder_name = top_level_folder_name
+                continue
+
+            data_key, separator, _ = relative_path.partition("/")
+            if separator and data_key not in data_folder_names:
+                data_folder_names[data_key] = f"{top_level_folder_name}/{data_key}"
+
+        if dist_info_folder_name is None:
+            raise RuntimeError(
+                f"Could not find `{_DIST_INFO_FOLDER_SUFFIX[1:]}` folder name."
+            )
+
+        return cls(
+            data_folder_names=data_folder_names,
+            dist_info_folder_name=dist_info_folder_name,
+            members=members,
+        )
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import os
+import socket
+import time
+import traceback
+from datetime import timedelta
+from pathlib import Path
+from shutil import rmtree
+from threading import Event, Thread
+from uuid import uuid4
+
+from .converter import Converter
+
+CLAIMED_FOLDER_NAME = "claimed"
+DONE_FOLDER_NAME = "done"
+FAILED_FOLDER_NAME = "failed"
+OUTPUT_FOLDER_NAME = "output"
+PENDING_FOLDER_NAME = "pending"
+
+_ERROR_SUFFIX = ".error"
+_WHEEL_SUFFIX = ".whl"
+
+
+def _get_new_claim_directory(claimed_directory: Path, /) -> Path:
+    return claimed_directory / f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex}"
+
+
+def _is_expired(claim_directory: Path, /, *, lease_duration: timedelta) -> bool:
+    # The modification time can be set by the clock of another machine: the lease duration must be much larger than the clock skew between workers.
+    try:
+        modification_time = claim_directory.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+    return time.time() - modification_time > lease_duration.total_seconds()
+
+
+def _claim_pending_wheel(queue_directory: Path, /) -> Path | None:
+    claimed_directory = queue_directory / CLAIMED_FOLDER_NAME
+
+    for wheel_path in sorted((queue_directory / PENDING_FOLDER_NAME).iterdir()):
+        if wheel_path.suffix != _WHEEL_SUFFIX:
+            continue
+
+        claim_directory = _get_new_claim_directory(claimed_directory)
+        claim_directory.mkdir()
+
+        try:
+            # Renames are atomic: only one worker can move the Wheel out of the pending folder.
+            claimed_wheel_path = wheel_path.rename(claim_directory / wheel_path.name)
+        except FileNotFoundError:
+            claim_directory.rmdir()
+        else:
+            return claimed_wheel_path
+
+    return None
+
+
+def _steal_expired_claim(
+    queue_directory: Path, /, *, lease_duration: timedelta
+) -> Path | None:
+    claimed_directory = queue_directory / CLAIMED_FOLDER_NAME
+
+    for claim_directory in sorted(claimed_directory.iterdir()):
+        if not _is_expired(claim_directory, lease_duration=lease_duration):
+            continue
+
+        new_claim_directory = _get_new_claim_directory(claimed_directory)
+
+        try:
+            # The worker that held the claim crashed or is too slow to renew its lease.
+            claim_directory.rename(new_claim_directory)
+        except FileNotFoundError:
+            continue
+
+        # Renames keep the modification time: until it is touched, the claim looks expired and can be stolen again by another worker.
+        if not _touch(new_claim_directory):
+            continue
+
+        try:
+            wheel_paths = [
+                path
+                for path in new_claim_directory.iterdir()
+                if path.suffix == _WHEEL_SUFFIX
+            ]
+        except FileNotFoundError:
+            continue
+
+        if wheel_paths:
+            (claimed_wheel_path,) = wheel_paths
+            return claimed_wheel_path
+
+        # The previous worker crashed before moving a Wheel in or after moving it out.
+        rmtree(new_claim_directory)
+
+    return None
+
+
+def _touch(path: Path, /) -> bool:
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        return False
+
+    return True
+
+
+def _renew_lease(
+    claim_directory: Path,
+    /,
+    *,
+    lease_duration: timedelta,
+    stopped: Event,
+) -> None:
+    while not stopped.wait(lease_duration.total_seconds() / 3):
+        if not _touch(claim_directory):
+            # The claim was stolen.
+            return
+
+
+def _process_claimed_wheel(
+    claimed_wheel_path: Path,
+    /,
+    *,
+    converter: Converter,
+    lease_duration: timedelta,
+    queue_directory: Path,
+) -> None:
+    claim_directory = claimed_wheel_path.parent
+    stopped = Event()
+    lease_renewer = Thread(
+        target=_renew_lease,
+        args=(claim_directory,),
+        kwargs={"lease_duration": lease_duration, "stopped": stopped},
+        daemon=True,
+    )
+    lease_renewer.start()
+
+    try:
+        try:
+            # The package is created in the claim folder and then moved so that readers of the output folder never see partial files.
+            conda_package_path = converter.convert(
+                claimed_wheel_path, output_directory=claim_directory
+            ).conda_package_path
+            conda_package_path.replace(
+                queue_directory / OUTPUT_FOLDER_NAME / conda_package_path.name
+            )
+        except Exception:  # noqa: BLE001
+            if not claim_directory.exists():
+                # The claim was stolen: the worker holding it now will write the result.
+                return
+
+            error_path = (
+                queue_directory
+                / FAILED_FOLDER_NAME
+                / f"{claimed_wheel_path.name}{_ERROR_SUFFIX}"
+            )
+            error_path.write_text(traceback.format_exc())
+            result_folder_name = FAILED_FOLDER_NAME
+        else:
+            result_folder_name = DONE_FOLDER_NAME
+
+        try:
+            claimed_wheel_path.rename(
+                queue_directory / result_folder_name / claimed_wheel_path.name
+            )
+        except FileNotFoundError:
+            return
+
+        rmtree(claim_directory)
+    finally:
+        stopped.set()
+        lease_renewer.join()
+
+
+def run_worker(
+    queue_directory: Path,
+    /,
+    *,
+    converter: Converter,
+    exit_when_empty: bool = False,
+    lease_duration: timedelta,
+    poll_interval: timedelta,
+) -> None:
+    """Convert the Wheels dropped in the pending folder of the queue until interrupted.
+
+    Several workers, possibly on different machines sharing the queue directory, can run at the same time.
+    Each Wheel is claimed by atomically moving it from the pending folder to a claim folder owned by the worker.
+    The worker renews its lease by touching that folder and claims whose lease expired are stolen by other workers.
+    Created packages are moved to the output folder, and converted Wheels to the done or failed folder.
+    """
+    for folder_name in [
+        CLAIMED_FOLDER_NAME,
+        DONE_FOLDER_NAME,
+        FAILED_FOLDER_NAME,
+        OUTPUT_FOLDER_NAME,
+        PENDING_FOLDER_NAME,
+    ]:
+        (queue_directory / folder_name).mkdir(exist_ok=True, parents=True)
+
+    while True:
+        claimed_wheel_path = _claim_pending_wheel(
+            queue_directory
+        ) or _steal_expired_claim(queue_directory, lease_duration=lease_duration)
+
+        if claimed_wheel_path:
+            _process_claimed_wheel(
+                claimed_wheel_path,
+                converter=converter,
+                lease_duration=lease_duration,
+                queue_directory=queue_directory,
+            )
+            continue
+
+        if exit_when_empty and not any(
+            (queue_directory / CLAIMED_FOLDER_NAME).iterdir()
+        ):
+            return
+
+        time.sleep(poll_interval.total_seconds())
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .converter import ConversionResult
+
+
+def write_explicit_lockfile(results: Iterable[ConversionResult], path: Path, /) -> None:
+    # Same format as `conda list --explicit --md5`: the file can be passed to `conda create --file`.
+    lines = [
+        "@EXPLICIT",
+        *[
+            f"{result.conda_package_path.resolve().as_uri()}#{result.md5}"
+            for result in results
+        ],
+    ]
+    path.write_text("".join(f"{line}\n" for line in lines))
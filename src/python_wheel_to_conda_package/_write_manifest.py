@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .converter import ConversionResult
+
+
+def write_manifest(results: Iterable[ConversionResult], path: Path, /) -> None:
+    manifest = [
+        {"path": str(result.conda_package_path.resolve()), **result.repodata_record}
+        for result in results
+    ]
+    path.write_text(f"{json.dumps(manifest, indent=2, sort_keys=True)}\n")
@@ -0,0 +1,512 @@
+from __future__ import annotations
+
+import os
+import sys
+from bz2 import BZ2File
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field, replace
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any
+from zipfile import ZipFile
+
+from ._atomic_path import atomic_path
+from ._clone_file import clone_file
+from ._compile_bytecode import compile_bytecode, get_compile_executor
+from ._conda_target import CondaTarget
+from ._filter_record_items import filter_record_items
+from ._get_conda_info_files import get_conda_info_files, get_index
+from ._get_conda_package_match_specification import (
+    CondaPackageMatchSpecification,
+    get_conda_package_match_specification,
+)
+from ._get_wheel_path_to_conda_path import get_wheel_path_to_conda_path
+from ._hashing_writer import HashingWriter
+from ._read_members import read_members
+from ._read_wheel import get_read_plan, open_wheel
+from ._read_zip_file import read_zip_file
+from ._repodata_shards import update_repodata_shards as _update_repodata_shards
+from ._rewrite_record import rewrite_record
+from ._rewrite_script_shebang import rewrite_script_shebang
+from ._tar_writer import DEFAULT_MODE, TarWriter
+from ._wheel_dist_info import RecordItem, WheelDistInfo
+from ._wheel_layout import WheelLayout
+from ._write_explicit_lockfile import write_explicit_lockfile
+from ._write_manifest import write_manifest
+
+_EXECUTABLE_MODE = 0o755
+_SCRIPTS_DATA_KEY = "scripts"
+
+_GetCondaPackageMatchSpecification = Callable[
+    [str], CondaPackageMatchSpecification | None
+]
+
+_OutputDirectory = Path | Sequence[Path]
+
+
+def _is_gil_enabled() -> bool:
+    # Python 3.13+ free-threaded builds can run threads in parallel unless an extension module re-enabled the GIL.
+    is_gil_enabled: Callable[[], bool] = getattr(sys, "_is_gil_enabled", lambda: True)
+    return is_gil_enabled()
+
+
+def _is_script(file_path: str, /, *, wheel_layout: WheelLayout) -> bool:
+    scripts_folder_name = wheel_layout.data_folder_names.get(_SCRIPTS_DATA_KEY)
+    return bool(scripts_folder_name) and file_path.startswith(f"{scripts_folder_name}/")
+
+
+def _get_mode(file_path: str, /, *, wheel_layout: WheelLayout) -> int:
+    return (
+        _EXECUTABLE_MODE
+        if _is_script(file_path, wheel_layout=wheel_layout)
+        else DEFAULT_MODE
+    )
+
+
+def _rewrite_scripts(
+    record_items: Iterable[RecordItem],
+    /,
+    *,
+    conda_target: CondaTarget,
+    wheel_layout: WheelLayout,
+    zip_file: ZipFile,
+) -> dict[str, bytes]:
+    if conda_target.platform == "win":
+        # Windows does not read shebangs.
+        return {}
+
+    rewritten_scripts: dict[str, bytes] = {}
+
+    for record_item in record_items:
+        if not _is_script(record_item.file_path, wheel_layout=wheel_layout):
+            continue
+
+        script = read_zip_file(zip_file, wheel_layout.members[record_item.file_path])
+        rewritten_script = rewrite_script_shebang(script)
+
+        if rewritten_script != script:
+            rewritten_scripts[record_item.file_path] = rewritten_script
+
+    return rewritten_scripts
+
+
+def _get_output_directories(
+    output_directory: _OutputDirectory | None, /, *, wheel_path: Path
+) -> list[Path]:
+    if output_directory is None:
+        return [wheel_path.parent]
+
+    output_directories = (
+        [output_directory]
+        if isinstance(output_directory, Path)
+        else list(output_directory)
+    )
+
+    if not output_directories:
+        raise ValueError("Expected at least one output directory.")
+
+    for directory in output_directories:
+        if not directory.exists():
+            directory.mkdir(exist_ok=True, parents=True)
+        elif not directory.is_dir():
+            raise ValueError(f"`{directory}` is not a directory.")
+
+    return output_directories
+
+
+@dataclass(frozen=True, kw_only=True)
+class ConversionResult:
+    """The outcome of the conversion of a Wheel.
+
+    The hashes and size are computed while the package is written: the package is never read back.
+    """
+
+    cloned_conda_package_paths: Sequence[Path] = ()
+    """The clones of the package in the other output directories."""
+
+    conda_package_path: Path
+    dropped_file_count: int = 0
+    """The number of Wheel files left out of the package by the *exclude* and *include* patterns of the `Converter`."""
+
+    dropped_size_in_bytes: int = 0
+    """The total size of the dropped Wheel files."""
+
+    index: Mapping[str, Any]
+    """The content of the package's ``info/index.json``."""
+
+    md5: str
+    sha256: str
+    size_in_bytes: int
+
+    @property
+    def repodata_record(self) -> dict[str, Any]:
+        """The entry of the package in the ``packages`` of a ``repodata.json``."""
+        return {
+            **self.index,
+            "md5": self.md5,
+            "sha256": self.sha256,
+            "size": self.size_in_bytes,
+        }
+
+
+@dataclass(frozen=True, kw_only=True)
+class Converter:
+    """Convert Wheels to Conda packages.
+
+    Pure-Python Wheels become noarch packages.
+    CPython Wheels for a supported platform (e.g. ``cp312-cp312-manylinux_2_17_x86_64`` or ``cp39-abi3-win_amd64``) become packages for the corresponding subdir and Python version.
+
+    A single instance can be used for many conversions: the state derived from previous conversions (e.g. the parsed requirements) is reused.
+
+    Instances are immutable and can be shared between threads.
+    Each conversion only mutates objects it created, apart from the thread-safe requirement cache, and writes the package to a temporary file renamed into place.
+    Concurrent conversions of the same Wheel to the same directory thus create the same package, byte for byte, as a single conversion.
+    On free-threaded Python builds, threads convert Wheels in parallel without the pickling and memory costs of processes.
+
+    Args:
+        cache_size: The maximum number of parsed requirements to keep in memory.
+        compile_bytecode: Whether to include the bytecode of the Python modules in the created packages so that conda does not compile them when installing.
+            Bytecode is specific to a Python version: the running one is targeted and pure-Python Wheels become packages for the running platform instead of noarch ones.
+        compile_process_count: The number of processes compiling bytecode when *compile_bytecode* is ``True``.
+            If 0, bytecode is compiled in the calling process.
+            The processes are started once per call to `convert` or `convert_many`.
+        compression_level: The bzip2 compression level, between 1 and 9, of the created packages.
+        exclude: Glob patterns, matched with `fnmatch.fnmatchcase`, of the Wheel files (e.g. ``*/tests/*`` or ``*.pyi``) to leave out of the created packages.
+            Paths are relative to the root of the Wheel and ``*`` matches ``/``.
+        include: Glob patterns of the Wheel files to keep in the created packages.
+            If empty, all the files not matched by *exclude* are kept.
+            The files of the ``.dist-info`` folder are always kept.
+        python_version: The ``(major, minor)`` Python version to target when converting ``abi3`` Wheels.
+        read_ahead_size_in_bytes: The maximum size of the Wheel members read ahead of the one being written when *read_thread_count* is not 0.
+        read_thread_count: The number of threads decompressing (and hashing) Wheel members while the previous ones are compressed into the package.
+            If 0, members are decompressed on the calling thread.
+        update_repodata_shards: Whether to add the created packages to the per-package-name repodata shards of their output directory.
+            Only the shard of the package name and the shard index are rewritten.
+        verify_hashes: Whether to check that the Wheel members match the sha256 declared in the Wheel's RECORD.
+    """
+
+    cache_size: int = 1024
+    compile_bytecode: bool = False
+    compile_process_count: int = 0
+    compression_level: int = 9
+    exclude: Sequence[str] = ()
+    include: Sequence[str] = ()
+    python_version: tuple[int, int] | None = None
+    read_ahead_size_in_bytes: int = 64 * 1024 * 1024
+    read_thread_count: int = 0
+    update_repodata_shards: bool = False
+    verify_hashes: bool = False
+
+    _get_conda_package_match_specification: _GetCondaPackageMatchSpecification = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for name in ["exclude", "include"]:
+            if isinstance(getattr(self, name), str):
+                # A string is a sequence of one-character patterns: `*` would drop every file.
+                raise TypeError(
+                    f"Expected `{name}` to be a sequence of patterns, got `{getattr(self, name)}`."
+                )
+
+        object.__setattr__(
+            self,
+            "_get_conda_package_match_specification",
+            lru_cache(maxsize=self.cache_size)(get_conda_package_match_specification),
+        )
+
+    def convert(
+        self,
+        wheel_path: Path,
+        /,
+        *,
+        output_directory: _OutputDirectory | None = None,
+    ) -> ConversionResult:
+        """Convert a Wheel to a Conda package.
+
+        Args:
+            wheel_path: The path to the Wheel file to convert.
+            output_directory: The directory, or directories, in which the Conda package will be created.
+                If ``None``, the directory of the input Wheel is used.
+                The package is written once in the first directory and then cloned in the other ones with a reflink, a hardlink, or, as a last resort, a copy.
+                Packages are moved into place once complete: readers of the output directories never see partial files.
+
+        Returns:
+            The path, hashes, and size of the created Conda package.
+        """
+        with self._get_compile_executor_context() as compile_executor:
+            return self._convert(
+                wheel_path,
+                compile_executor=compile_executor,
+                output_directory=output_directory,
+            )
+
+    def _get_compile_executor_context(
+        self,
+    ) -> AbstractContextManager[ProcessPoolExecutor | None]:
+        if self.compile_bytecode and self.compile_process_count:
+            return get_compile_executor(process_count=self.compile_process_count)
+
+        return nullcontext()
+
+    def _convert(
+        self,
+        wheel_path: Path,
+        /,
+        *,
+        compile_executor: ProcessPoolExecutor | None,
+        output_directory: _OutputDirectory | None,
+    ) -> ConversionResult:
+        if not wheel_path.is_file():
+            raise ValueError(f"`{wheel_path}` does not point to an existing path.")
+
+        output_directories = _get_output_directories(
+            output_directory, wheel_path=wheel_path
+        )
+
+        timestamp = round(wheel_path.stat().st_mtime * 1000)
+
+        with open_wheel(wheel_path) as wheel_file, ZipFile(wheel_file) as zip_file:
+            wheel_layout = WheelLayout.from_zip_file(zip_file)
+
+            wheel_dist_info = WheelDistInfo.read(zip_file, wheel_layout=wheel_layout)
+            conda_target = CondaTarget.from_wheel(
+                wheel_dist_info.wheel, python_version=self.python_version
+            )
+
+            if self.compile_bytecode:
+                conda_target = conda_target.for_bytecode(
+                    python_version=self.python_version
+                )
+
+            record_items, dropped_record_items = filter_record_items(
+                wheel_dist_info.record.items, exclude=self.exclude, include=self.include
+            )
+            # The files whose content in the package differs from the one in the Wheel.
+            rewritten_files = _rewrite_scripts(
+                record_items,
+                conda_target=conda_target,
+                wheel_layout=wheel_layout,
+                zip_file=zip_file,
+            )
+
+            if dropped_record_items or rewritten_files:
+                # The installed RECORD must list the files of the package, as they are in the package.
+                record_path = f"{wheel_layout.dist_info_folder_name}/RECORD"
+                rewritten_files[record_path] = rewrite_record(
+                    read_zip_file(zip_file, wheel_layout.members[record_path]),
+                    dropped_file_paths={
+                        record_item.file_path for record_item in dropped_record_items
+                    },
+                    rewritten_files=rewritten_files,
+                )
+
+            # Both `paths.json` and the payload are derived from the filtered and rewritten record.
+            wheel_dist_info = replace(
+                wheel_dist_info,
+                record=replace(
+                    wheel_dist_info.record,
+                    items=[
+                        RecordItem.from_file_path_and_record(
+                            record_item.file_path,
+                            rewritten_files[record_item.file_path],
+                        )
+                        if record_item.file_path in rewritten_files
+                        else record_item
+                        for record_item in record_items
+                    ],
+                ),
+            )
+            read_plan = get_read_plan(
+                [
+                    record_item
+                    for record_item in record_items
+                    if record_item.file_path not in rewritten_files
+                ],
+                wheel_layout=wheel_layout,
+            )
+            bytecode: dict[str, bytes] = {}
+
+            if self.compile_bytecode:
+                sources: dict[str, bytes] = {}
+
+                for record_item in read_plan:
+                    conda_path = get_wheel_path_to_conda_path(
+                        record_item.file_path,
+                        conda_target=conda_target,
+                        data_folder_names=wheel_layout.data_folder_names,
+                    )
+
+                    if conda_path.startswith(
+                        f"{conda_target.site_packages_path}/"
+                    ) and conda_path.endswith(".py"):
+                        sources[conda_path] = read_zip_file(
+                            zip_file, wheel_layout.members[record_item.file_path]
+                        )
+
+                bytecode = compile_bytecode(
+                    sources,
+                    executor=compile_executor,
+                    process_count=self.compile_process_count,
+                )
+
+            index = get_index(
+                conda_target=conda_target,
+                get_conda_package_match_specification=self._get_conda_package_match_specification,
+                timestamp=timestamp,
+                wheel_dist_info=wheel_dist_info,
+            )
+            conda_info_files = get_conda_info_files(
+                bytecode=bytecode,
+                conda_target=conda_target,
+                data_folder_names=wheel_layout.data_folder_names,
+                index=index,
+                wheel_dist_info=wheel_dist_info,
+            )
+
+            conda_package_file_name = (
+                f"{index['name']}-{index['version']}-{index['build']}.tar.bz2"
+            )
+            conda_package_path = output_directories[0] / conda_package_file_name
+
+            executor_context: AbstractContextManager[ThreadPoolExecutor | None]
+            if self.read_thread_count:
+                executor_context = ThreadPoolExecutor(
+                    max_workers=self.read_thread_count
+                )
+            else:
+                executor_context = nullcontext()
+
+            with (
+                executor_context as executor,
+                atomic_path(conda_package_path) as temporary_conda_package_path,
+                temporary_conda_package_path.open("wb") as file,
+                BZ2File(
+                    hashing_writer := HashingWriter(file),
+                    mode="wb",
+                    compresslevel=self.compression_level,
+                ) as compressed_file,
+            ):
+                tar_writer = TarWriter(compressed_file)
+
+                for file_path, file_content in conda_info_files.items():
+                    tar_writer.add(f"info/{file_path}", bytes(file_content, "utf-8"))
+
+                for record_item, content in read_members(
+                    zip_file,
+                    read_plan,
+                    executor=executor,
+                    read_ahead_size_in_bytes=self.read_ahead_size_in_bytes,
+                    verify_hashes=self.verify_hashes,
+                ):
+                    conda_path = get_wheel_path_to_conda_path(
+                        record_item.file_path,
+                        conda_target=conda_target,
+                        data_folder_names=wheel_layout.data_folder_names,
+                    )
+
+                    mode = _get_mode(record_item.file_path, wheel_layout=wheel_layout)
+
+                    if isinstance(content, bytes):
+                        tar_writer.add(conda_path, content, mode=mode)
+                    else:
+                        tar_writer.add_stream(
+                            conda_path,
+                            content,
+                            mode=mode,
+                            size=wheel_layout.members[record_item.file_path].file_size,
+                        )
+
+                for file_path, content in rewritten_files.items():
+                    tar_writer.add(
+                        get_wheel_path_to_conda_path(
+                            file_path,
+                            conda_target=conda_target,
+                            data_folder_names=wheel_layout.data_folder_names,
+                        ),
+                        content,
+                        mode=_get_mode(file_path, wheel_layout=wheel_layout),
+                    )
+
+                for pyc_path, pyc in bytecode.items():
+                    tar_writer.add(pyc_path, pyc)
+
+                tar_writer.close()
+
+        cloned_conda_package_paths = [
+            directory / conda_package_file_name for directory in output_directories[1:]
+        ]
+
+        for cloned_conda_package_path in cloned_conda_package_paths:
+            clone_file(conda_package_path, cloned_conda_package_path)
+
+        result = ConversionResult(
+            cloned_conda_package_paths=cloned_conda_package_paths,
+            conda_package_path=conda_package_path,
+            dropped_file_count=len(dropped_record_items),
+            dropped_size_in_bytes=sum(
+                record_item.size_in_bytes for record_item in dropped_record_items
+            ),
+            index=index,
+            md5=hashing_writer.md5,
+            sha256=hashing_writer.sha256,
+            size_in_bytes=hashing_writer.size_in_bytes,
+        )
+
+        if self.update_repodata_shards:
+            for path in [conda_package_path, *cloned_conda_package_paths]:
+                _update_repodata_shards(path, repodata_record=result.repodata_record)
+
+        return result
+
+    def convert_many(
+        self,
+        wheel_paths: Iterable[Path],
+        /,
+        *,
+        explicit_lockfile_path: Path | None = None,
+        manifest_path: Path | None = None,
+        output_directory: _OutputDirectory | None = None,
+        thread_count: int | None = None,
+    ) -> list[ConversionResult]:
+        """Convert Wheels to Conda packages.
+
+        Args:
+            wheel_paths: The paths to the Wheel files to convert.
+            explicit_lockfile_path: If not ``None``, the path of an ``@EXPLICIT`` lockfile listing the created packages to write.
+                It can be passed to ``conda create --file``.
+            manifest_path: If not ``None``, the path of a JSON file listing the path, hashes, size, and ``index.json`` of the created packages to write.
+            output_directory: The directory, or directories, in which the Conda packages will be created.
+                If ``None``, the directory of each input Wheel is used.
+            thread_count: The number of Wheels to convert concurrently on a thread pool.
+                If ``None``, it is the number of CPUs when the GIL is disabled (i.e. on free-threaded Python builds) and 1 otherwise.
+
+        Returns:
+            The results of the conversions, in the order of *wheel_paths*.
+        """
+        if thread_count is None:
+            thread_count = 1 if _is_gil_enabled() else os.cpu_count() or 1
+
+        # The compilation processes are started once and shared by all the conversions.
+        with self._get_compile_executor_context() as compile_executor:
+            convert = partial(
+                self._convert,
+                compile_executor=compile_executor,
+                output_directory=output_directory,
+            )
+
+            if thread_count > 1:
+                with ThreadPoolExecutor(max_workers=thread_count) as executor:
+                    results = list(executor.map(convert, wheel_paths))
+            else:
+                results = [convert(wheel_path) for wheel_path in wheel_paths]
+
+        if explicit_lockfile_path:
+            write_explicit_lockfile(results, explicit_lockfile_path)
+
+        if manifest_path:
+            write_manifest(results, manifest_path)
+
+        return results
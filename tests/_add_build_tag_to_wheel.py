@@ -5,9 +5,6 @@ from zipfile import ZIP_DEFLATED, ZipFile
 
 import pytest
 
-from python_wheel_to_conda_package._get_dist_info_folder_name import (
-    get_dist_info_folder_name,
-)
 from python_wheel_to_conda_package._read_zip_file import read_zip_file
 from python_wheel_to_conda_package._wheel_dist_info import (
     _RECORD_FILENAME,
@@ -16,6 +13,7 @@ from python_wheel_to_conda_package._wheel_dist_info import (
     RecordItem,
     Wheel,
 )
+from python_wheel_to_conda_package._wheel_layout import WheelLayout
 
 
 def add_build_tag_to_wheel(wheel_path: Path, build_tag: str, /) -> None:
@@ -23,9 +21,9 @@ def add_build_tag_to_wheel(wheel_path: Path, build_tag: str, /) -> None:
         pytest.warns(UserWarning, match=re.escape("Duplicate name")),
         ZipFile(wheel_path, mode="a", compression=ZIP_DEFLATED) as zip_file,
     ):
-        file_paths = zip_file.namelist()
-
-        dist_info_folder_name = get_dist_info_folder_name(file_paths)
+        dist_info_folder_name = WheelLayout.from_zip_file(
+            zip_file
+        ).dist_info_folder_name
 
         wheel_file_path = f"{dist_info_folder_name}/{_WHEEL_FILENAME}"
 
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from base64 import urlsafe_b64encode
+from collections.abc import Mapping, Sequence
+from hashlib import sha256
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZipFile
+
+
+def _get_record_line(file_path: str, content: bytes, /) -> str:
+    digest = urlsafe_b64encode(sha256(content).digest()).decode().rstrip("=")
+    return f"{file_path},sha256={digest},{len(content)}"
+
+
+def build_wheel(
+    directory: Path,
+    /,
+    *,
+    files: Mapping[str, bytes],
+    name: str = "lib",
+    record_order: Sequence[str] | None = None,
+    tag: str = "py3-none-any",
+) -> Path:
+    """Write a minimal Wheel with the members in the order of `files` and the RECORD lines in `record_order`."""
+    version = "1.0"
+    dist_info_folder_name = f"{name}-{version}.dist-info"
+    is_pure = tag.endswith("-none-any")
+
+    dist_info_files = {
+        f"{dist_info_folder_name}/METADATA": f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\nRequires-Python: >=3.10\n".encode(),
+        f"{dist_info_folder_name}/WHEEL": f"Wheel-Version: 1.0\nRoot-Is-Purelib: {str(is_pure).lower()}\nTag: {tag}\n".encode(),
+    }
+    all_files = {**files, **dist_info_files}
+
+    record_path = f"{dist_info_folder_name}/RECORD"
+    record = "\n".join(
+        [
+            *[
+                _get_record_line(file_path, all_files[file_path])
+                for file_path in (record_order or [*files])
+            ],
+            *[
+                _get_record_line(file_path, content)
+                for file_path, content in dist_info_files.items()
+            ],
+            f"{record_path},,",
+            "",
+        ]
+    )
+
+    wheel_path = directory / f"{name}-{version}-{tag}.whl"
+
+    with ZipFile(wheel_path, mode="w", compression=ZIP_DEFLATED) as zip_file:
+        for file_path, content in {**all_files, record_path: record.encode()}.items():
+            zip_file.writestr(file_path, content)
+
+    return wheel_path
@@ -1,5 +1,7 @@
+import json
+import tarfile
 from pathlib import Path
-from subprocess import check_output
+from subprocess import PIPE, check_output, run
 
 
 def test_cli(tmp_path: Path, wheel_path: Path) -> None:
@@ -12,9 +14,62 @@ def test_cli(tmp_path: Path, wheel_path: Path) -> None:
             str(wheel_path),
             "--output-directory",
             str(output_directory),
+            "--explicit-lockfile",
+            str(tmp_path / "explicit.txt"),
         ],
         text=True,
     )
     conda_package_path = Path(output.rstrip())
     assert conda_package_path.is_file()
     assert conda_package_path.parent == output_directory
+    assert (
+        (tmp_path / "explicit.txt")
+        .read_text()
+        .startswith(f"@EXPLICIT\n{conda_package_path.as_uri()}#")
+    )
+
+
+def test_cli_filter_file(tmp_path: Path, wheel_path: Path) -> None:
+    filter_file_path = tmp_path / "filter.json"
+    filter_file_path.write_text(json.dumps({"exclude": ["*.py"]}))
+    output = check_output(
+        [
+            "uv",
+            "run",
+            "python-wheel-to-conda-package",
+            str(wheel_path),
+            "--output-directory",
+            str(tmp_path),
+            "--filter-file",
+            str(filter_file_path),
+            "--include",
+            "test_lib/*",
+        ],
+        text=True,
+    )
+    with tarfile.open(output.rstrip()) as tar:
+        member_names = tar.getnames()
+    assert not any(name.endswith(".py") for name in member_names)
+    assert any(name.startswith("site-packages/test_lib/") for name in member_names)
+
+
+def test_cli_filter_file_with_string_patterns(tmp_path: Path, wheel_path: Path) -> None:
+    filter_file_path = tmp_path / "filter.json"
+    filter_file_path.write_text(json.dumps({"exclude": "*.pyi"}))
+    completed_process = run(  # noqa: PLW1510
+        [
+            "uv",
+            "run",
+            "python-wheel-to-conda-package",
+            str(wheel_path),
+            "--output-directory",
+            str(tmp_path / "output"),
+            "--filter-file",
+            str(filter_file_path),
+        ],
+        stderr=PIPE,
+        text=True,
+    )
+    assert completed_process.returncode
+    assert "Expected `exclude`" in completed_process.stderr
+    assert not (tmp_path / "output").exists()
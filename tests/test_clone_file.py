@@ -0,0 +1,37 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from python_wheel_to_conda_package import _clone_file
+from python_wheel_to_conda_package._clone_file import clone_file
+
+
+def _fail(*_args: object) -> bool:
+    raise OSError
+
+
+@pytest.mark.parametrize("method", ["reflink", "hardlink", "copy"])
+def test_clone_file(
+    method: str, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    if method != "reflink":
+        monkeypatch.setattr(_clone_file, "_reflink", lambda *_args: False)
+    if method == "copy":
+        monkeypatch.setattr(os, "link", _fail)
+
+    source = tmp_path / "source.tar.bz2"
+    source.write_bytes(os.urandom(1024))
+    target_directory = tmp_path / "target"
+    target_directory.mkdir()
+    target = target_directory / source.name
+    target.write_bytes(b"previous version")
+
+    clone_file(source, target)
+
+    assert target.read_bytes() == source.read_bytes()
+    assert [*target_directory.iterdir()] == [target]
+    if method == "hardlink":
+        assert target.samefile(source)
+    if method == "copy":
+        assert not target.samefile(source)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import stat
+import tarfile
+from contextlib import nullcontext
+from pathlib import Path
+
+import pytest
+
+from python_wheel_to_conda_package import python_wheel_to_conda_package
+from python_wheel_to_conda_package._conda_target import CondaTarget
+from python_wheel_to_conda_package._wheel_dist_info import Wheel
+
+from ._build_wheel import build_wheel
+
+
+@pytest.mark.parametrize(
+    ("tags", "python_version", "expected_conda_target", "expected_error_pattern"),
+    [
+        (["py3-none-any"], None, CondaTarget(), None),
+        (["py2-none-any", "py3-none-any"], None, CondaTarget(), None),
+        (
+            [
+                "cp312-cp312-manylinux_2_17_x86_64",
+                "cp312-cp312-manylinux2014_x86_64",
+            ],
+            None,
+            CondaTarget(
+                architecture="x86_64",
+                platform="linux",
+                python_version=(3, 12),
+                subdir="linux-64",
+            ),
+            None,
+        ),
+        (
+            ["cp311-cp311-macosx_11_0_arm64"],
+            (3, 11),
+            CondaTarget(
+                architecture="arm64",
+                platform="osx",
+                python_version=(3, 11),
+                subdir="osx-arm64",
+            ),
+            None,
+        ),
+        (
+            ["cp39-abi3-win_amd64"],
+            (3, 13),
+            CondaTarget(
+                architecture="x86_64",
+                platform="win",
+                python_version=(3, 13),
+                subdir="win-64",
+            ),
+            None,
+        ),
+        (
+            ["cp39-abi3-win_amd64"],
+            None,
+            None,
+            re.escape("The targeted Python version must be specified"),
+        ),
+        (
+            ["cp312-abi3-manylinux_2_28_aarch64"],
+            (3, 11),
+            None,
+            re.escape("requiring Python 3.12 or later"),
+        ),
+        (
+            ["cp311-cp311-manylinux_2_17_x86_64"],
+            (3, 12),
+            None,
+            re.escape("Cannot target Python 3.12 with a Wheel built for Python 3.11."),
+        ),
+        (
+            ["cp312-cp312-musllinux_1_2_x86_64"],
+            None,
+            None,
+            re.escape("Unsupported platform tag `musllinux_1_2_x86_64`."),
+        ),
+        (
+            ["cp312-cp312-macosx_10_9_universal2"],
+            None,
+            None,
+            re.escape("Unsupported platform and architecture"),
+        ),
+        (
+            ["cp311-cp311-win_amd64", "cp312-cp312-win_amd64"],
+            None,
+            None,
+            re.escape("Expected the tags to all target the same platform"),
+        ),
+    ],
+)
+def test_conda_target_from_wheel(
+    tags: list[str],
+    python_version: tuple[int, int] | None,
+    expected_conda_target: CondaTarget | None,
+    expected_error_pattern: str | None,
+) -> None:
+    context_manager = (
+        pytest.raises(ValueError, match=expected_error_pattern)
+        if expected_error_pattern
+        else nullcontext()
+    )
+
+    with context_manager:
+        conda_target = CondaTarget.from_wheel(
+            Wheel(tags=tags), python_version=python_version
+        )
+        assert conda_target == expected_conda_target
+
+
+def test_platform_specific_conda_package(tmp_path: Path) -> None:
+    wheel_path = build_wheel(
+        tmp_path,
+        files={
+            "lib/__init__.py": b"",
+            "lib-1.0.data/platlib/lib/_extension.so": b"\x7fELF",
+        },
+        tag="cp311-cp311-manylinux_2_17_x86_64",
+    )
+
+    conda_package_path = python_wheel_to_conda_package(
+        wheel_path, output_directory=tmp_path / "linux-64"
+    )
+
+    assert conda_package_path.name == "lib-1.0-py311_0.tar.bz2"
+
+    with tarfile.open(conda_package_path) as tar:
+        names = tar.getnames()
+        index_file = tar.extractfile("info/index.json")
+        assert index_file
+        index = json.load(index_file)
+
+    assert "info/link.json" not in names
+    assert "lib/python3.11/site-packages/lib/__init__.py" in names
+    assert "lib/python3.11/site-packages/lib/_extension.so" in names
+    assert {key: index[key] for key in ["arch", "platform", "subdir"]} == {
+        "arch": "x86_64",
+        "platform": "linux",
+        "subdir": "linux-64",
+    }
+    assert "noarch" not in index
+    assert index["depends"] == ["python >=3.11,<3.12.0a0", "python_abi 3.11.* *_cp311"]
+
+
+@pytest.mark.parametrize(
+    ("tag", "expected_script_path", "expected_header_path", "expected_shebang"),
+    [
+        (
+            "cp312-cp312-manylinux_2_17_x86_64",
+            "bin/run",
+            "include/lib.h",
+            b"#!/usr/bin/env python\n",
+        ),
+        (
+            "cp312-cp312-win_amd64",
+            "Scripts/run",
+            "Include/lib.h",
+            b"#!python\n",
+        ),
+        (
+            "py3-none-any",
+            "python-scripts/run",
+            "include/lib.h",
+            b"#!/usr/bin/env python\n",
+        ),
+    ],
+)
+def test_scripts_and_headers(
+    tag: str,
+    expected_script_path: str,
+    expected_header_path: str,
+    expected_shebang: bytes,
+    tmp_path: Path,
+) -> None:
+    script_body = b"import lib\n"
+    wheel_path = build_wheel(
+        tmp_path,
+        files={
+            "lib/__init__.py": b"",
+            "lib-1.0.data/headers/lib.h": b"int lib(void);\n",
+            "lib-1.0.data/scripts/run": b"#!python\n" + script_body,
+        },
+        tag=tag,
+    )
+
+    conda_package_path = python_wheel_to_conda_package(
+        wheel_path, output_directory=tmp_path / "output"
+    )
+
+    with tarfile.open(conda_package_path) as tar:
+        names = tar.getnames()
+        script_info = tar.getmember(expected_script_path)
+        script_file = tar.extractfile(script_info)
+        assert script_file
+        script = script_file.read()
+        paths_file = tar.extractfile("info/paths.json")
+        assert paths_file
+        paths = {path["_path"]: path for path in json.load(paths_file)["paths"]}
+
+    assert expected_header_path in names
+    assert not any(".data/" in name for name in names)
+    assert script == expected_shebang + script_body
+    assert script_info.mode & stat.S_IXUSR
+    assert paths[expected_script_path]["sha256"] == hashlib.sha256(script).hexdigest()
+    assert paths[expected_script_path]["size_in_bytes"] == len(script)
@@ -0,0 +1,340 @@
+import hashlib
+import json
+import os
+import py_compile
+import re
+import sys
+import tarfile
+from base64 import urlsafe_b64encode
+from concurrent.futures import ProcessPoolExecutor
+from importlib.metadata import Distribution
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from python_wheel_to_conda_package import (
+    Converter,
+    _compile_bytecode,
+    _read_members,
+    converter,
+    python_wheel_to_conda_package,
+)
+
+from ._build_wheel import build_wheel
+
+
+def test_converter_reuse(tmp_path: Path, wheel_path: Path) -> None:
+    expected_conda_package = python_wheel_to_conda_package(
+        wheel_path, output_directory=tmp_path / "expected"
+    ).read_bytes()
+
+    converter = Converter(cache_size=1)
+
+    for index in range(3):
+        conda_package_path = converter.convert(
+            wheel_path, output_directory=tmp_path / str(index)
+        ).conda_package_path
+        assert conda_package_path.read_bytes() == expected_conda_package
+
+    fastest_conda_package_path = (
+        Converter(compression_level=1)
+        .convert(wheel_path, output_directory=tmp_path / "fastest")
+        .conda_package_path
+    )
+    assert fastest_conda_package_path.read_bytes() != expected_conda_package
+
+
+@pytest.fixture(name="wheel_with_large_members_path")
+def wheel_with_large_members_path_fixture(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> Path:
+    monkeypatch.setattr(_read_members, "_BATCH_SIZE_IN_BYTES", 4096)
+    monkeypatch.setattr(_read_members, "_STREAM_MIN_SIZE_IN_BYTES", 64 * 1024)
+    return build_wheel(
+        tmp_path,
+        files={
+            f"lib/module_{index}.py": os.urandom(index * 1024)
+            for index in range(0, 100, 7)
+        },
+    )
+
+
+@pytest.mark.parametrize("read_ahead_size_in_bytes", [0, 16 * 1024, 1024 * 1024])
+def test_pipelined_conversion(
+    read_ahead_size_in_bytes: int, tmp_path: Path, wheel_with_large_members_path: Path
+) -> None:
+    expected_conda_package = (
+        Converter()
+        .convert(wheel_with_large_members_path, output_directory=tmp_path / "expected")
+        .conda_package_path.read_bytes()
+    )
+
+    conda_package_path = (
+        Converter(
+            read_ahead_size_in_bytes=read_ahead_size_in_bytes,
+            read_thread_count=4,
+            verify_hashes=True,
+        )
+        .convert(wheel_with_large_members_path, output_directory=tmp_path / "pipelined")
+        .conda_package_path
+    )
+
+    assert conda_package_path.read_bytes() == expected_conda_package
+
+
+@pytest.mark.parametrize("file_path", ["lib/module_7.py", "lib/module_98.py"])
+@pytest.mark.parametrize("read_thread_count", [0, 2])
+def test_verify_hashes(
+    file_path: str,
+    read_thread_count: int,
+    tmp_path: Path,
+    wheel_with_large_members_path: Path,
+) -> None:
+    with (
+        pytest.warns(UserWarning, match=re.escape("Duplicate name")),
+        ZipFile(wheel_with_large_members_path, mode="a") as zip_file,
+    ):
+        zip_file.writestr(file_path, os.urandom(zip_file.getinfo(file_path).file_size))
+
+    Converter(read_thread_count=read_thread_count).convert(
+        wheel_with_large_members_path, output_directory=tmp_path
+    )
+
+    with pytest.raises(ValueError, match=re.escape(f"Expected `{file_path}`")):
+        Converter(read_thread_count=read_thread_count, verify_hashes=True).convert(
+            wheel_with_large_members_path, output_directory=tmp_path
+        )
+
+
+def test_convert_many(tmp_path: Path, wheel_path: Path) -> None:
+    explicit_lockfile_path = tmp_path / "explicit.txt"
+    manifest_path = tmp_path / "manifest.json"
+
+    results = Converter().convert_many(
+        [wheel_path, build_wheel(tmp_path, files={"lib/__init__.py": b""})],
+        explicit_lockfile_path=explicit_lockfile_path,
+        manifest_path=manifest_path,
+        output_directory=tmp_path / "output",
+    )
+
+    for result in results:
+        conda_package = result.conda_package_path.read_bytes()
+        assert result.md5 == hashlib.md5(conda_package).hexdigest()  # noqa: S324
+        assert result.sha256 == hashlib.sha256(conda_package).hexdigest()
+        assert result.size_in_bytes == len(conda_package)
+
+    assert explicit_lockfile_path.read_text().splitlines() == [
+        "@EXPLICIT",
+        *[f"{result.conda_package_path.as_uri()}#{result.md5}" for result in results],
+    ]
+
+    manifest = json.loads(manifest_path.read_text())
+    assert [package["path"] for package in manifest] == [
+        str(result.conda_package_path) for result in results
+    ]
+    assert manifest[1]["name"] == "lib"
+    assert manifest[1]["sha256"] == results[1].sha256
+
+
+def test_compile_bytecode(tmp_path: Path) -> None:
+    source = b"VALUE = 42\n"
+    wheel_path = build_wheel(
+        tmp_path,
+        files={"lib/__init__.py": source, "lib/template.py": b"{% if template %}\n"},
+    )
+
+    result = Converter(compile_bytecode=True).convert(
+        wheel_path, output_directory=tmp_path / "sequential"
+    )
+    assert (
+        Converter(compile_bytecode=True, compile_process_count=2)
+        .convert(wheel_path, output_directory=tmp_path / "parallel")
+        .conda_package_path.read_bytes()
+        == result.conda_package_path.read_bytes()
+    )
+    assert "noarch" not in result.index
+    assert result.index["subdir"] != "noarch"
+
+    site_packages_path = (
+        f"lib/python{sys.version_info[0]}.{sys.version_info[1]}/site-packages"
+    )
+    py_path = f"{site_packages_path}/lib/__init__.py"
+    pyc_path = f"{site_packages_path}/lib/__pycache__/__init__.{sys.implementation.cache_tag}.pyc"
+    source_path = tmp_path / "__init__.py"
+    source_path.write_bytes(source)
+    expected_pyc_path = tmp_path / "__init__.pyc"
+    py_compile.compile(
+        str(source_path),
+        cfile=str(expected_pyc_path),
+        dfile=py_path,
+        invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+    )
+
+    with tarfile.open(result.conda_package_path) as tar:
+        member_names = tar.getnames()
+        pyc_file = tar.extractfile(pyc_path)
+        assert pyc_file
+        assert pyc_file.read() == expected_pyc_path.read_bytes()
+        paths_file = tar.extractfile("info/paths.json")
+        assert paths_file
+        paths = [path["_path"] for path in json.load(paths_file)["paths"]]
+
+    assert "info/link.json" not in member_names
+    assert sorted(paths) == sorted(
+        name for name in member_names if not name.startswith("info/")
+    )
+    assert not any("template" in path for path in paths if path.endswith(".pyc"))
+
+
+def test_compile_bytecode_processes_are_shared(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    wheel_paths = [
+        build_wheel(tmp_path, files={f"{name}/__init__.py": b"VALUE = 42\n"}, name=name)
+        for name in ["first", "second", "third"]
+    ]
+    expected_conda_packages = [
+        result.conda_package_path.read_bytes()
+        for result in Converter(compile_bytecode=True).convert_many(
+            wheel_paths, output_directory=tmp_path / "sequential"
+        )
+    ]
+
+    compile_executor_process_counts: list[int] = []
+
+    def get_compile_executor(*, process_count: int) -> ProcessPoolExecutor:
+        compile_executor_process_counts.append(process_count)
+        return _compile_bytecode.get_compile_executor(process_count=process_count)
+
+    monkeypatch.setattr(converter, "get_compile_executor", get_compile_executor)
+
+    results = Converter(compile_bytecode=True, compile_process_count=2).convert_many(
+        wheel_paths, output_directory=tmp_path / "parallel", thread_count=3
+    )
+
+    assert compile_executor_process_counts == [2]
+    assert [
+        result.conda_package_path.read_bytes() for result in results
+    ] == expected_conda_packages
+
+
+def test_compile_bytecode_for_other_python_version(
+    tmp_path: Path, wheel_path: Path
+) -> None:
+    with pytest.raises(
+        ValueError, match=re.escape("Cannot compile bytecode for CPython 3.99")
+    ):
+        Converter(compile_bytecode=True, python_version=(3, 99)).convert(
+            wheel_path, output_directory=tmp_path
+        )
+
+
+def test_several_output_directories(tmp_path: Path, wheel_path: Path) -> None:
+    output_directories = [tmp_path / name for name in ["dev", "staging", "team"]]
+
+    result = Converter(update_repodata_shards=True).convert(
+        wheel_path, output_directory=output_directories
+    )
+
+    assert result.conda_package_path.parent == output_directories[0]
+    assert [path.parent for path in result.cloned_conda_package_paths] == (
+        output_directories[1:]
+    )
+    for path in result.cloned_conda_package_paths:
+        assert path.read_bytes() == result.conda_package_path.read_bytes()
+    for directory in output_directories:
+        assert sorted(path.name for path in directory.iterdir()) == sorted(
+            [
+                result.conda_package_path.name,
+                "repodata_shards.json.gz",
+                "repodata_shards.lock",
+                "shards",
+            ]
+        )
+
+
+@pytest.mark.parametrize(
+    ("exclude", "include", "expected_file_paths"),
+    [
+        (
+            ["*/tests/*", "*.pyi", "*/py.typed"],
+            [],
+            ["lib/__init__.py"],
+        ),
+        ([], ["lib/*.py"], ["lib/__init__.py", "lib/tests/test_lib.py"]),
+        (["*/tests/*"], ["lib/*.py"], ["lib/__init__.py"]),
+    ],
+)
+def test_filter_files(
+    exclude: list[str],
+    include: list[str],
+    expected_file_paths: list[str],
+    tmp_path: Path,
+) -> None:
+    files = {
+        "lib/__init__.py": b"VALUE = 42\n",
+        "lib/__init__.pyi": b"VALUE: int\n",
+        "lib/py.typed": b"",
+        "lib/tests/test_lib.py": b"def test_value() -> None: ...\n",
+    }
+    wheel_path = build_wheel(tmp_path, files=files)
+
+    result = Converter(exclude=exclude, include=include).convert(
+        wheel_path, output_directory=tmp_path / "output"
+    )
+
+    with tarfile.open(result.conda_package_path) as tar:
+        member_names = tar.getnames()
+        paths_file = tar.extractfile("info/paths.json")
+        assert paths_file
+        paths = [path["_path"] for path in json.load(paths_file)["paths"]]
+
+    assert sorted(paths) == sorted(
+        name for name in member_names if not name.startswith("info/")
+    )
+    assert sorted(
+        path.removeprefix("site-packages/")
+        for path in paths
+        if not path.startswith("site-packages/lib-")
+    ) == sorted(expected_file_paths)
+    dropped_file_paths = files.keys() - set(expected_file_paths)
+    assert result.dropped_file_count == len(dropped_file_paths)
+
+    extracted_directory = tmp_path / "extracted"
+    with tarfile.open(result.conda_package_path) as tar:
+        tar.extractall(extracted_directory, filter="data")
+    for path in json.loads((extracted_directory / "info" / "paths.json").read_text())[
+        "paths"
+    ]:
+        assert (
+            hashlib.sha256(
+                (extracted_directory / path["_path"]).read_bytes()
+            ).hexdigest()
+            == path["sha256"]
+        )
+    distribution = Distribution.at(
+        extracted_directory / "site-packages" / "lib-1.0.dist-info"
+    )
+    distribution_files = distribution.files
+    assert distribution_files
+    assert sorted(
+        str(file) for file in distribution_files if ".dist-info/" not in str(file)
+    ) == sorted(expected_file_paths)
+    for file in distribution_files:
+        assert Path(file.locate()).is_file()
+        if file.hash:
+            assert file.hash.value == urlsafe_b64encode(
+                hashlib.sha256(file.read_binary()).digest()
+            ).decode().rstrip("=")
+    assert result.dropped_size_in_bytes == sum(
+        len(files[file_path]) for file_path in dropped_file_paths
+    )
+
+
+@pytest.mark.parametrize("name", ["exclude", "include"])
+def test_filter_patterns_must_not_be_a_string(name: str) -> None:
+    with pytest.raises(
+        TypeError, match=re.escape(f"Expected `{name}` to be a sequence of patterns")
+    ):
+        Converter(**{name: "*.pyi"})  # type: ignore[arg-type]
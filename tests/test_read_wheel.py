@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+import time
+from datetime import timedelta
+from io import BufferedReader, FileIO
+from pathlib import Path
+from typing import TYPE_CHECKING
+from zipfile import ZipFile
+
+import pytest
+
+from python_wheel_to_conda_package import _read_wheel, python_wheel_to_conda_package
+
+from ._build_wheel import build_wheel
+
+if TYPE_CHECKING:
+    from _typeshed import WriteableBuffer
+
+_LATENCY = timedelta(milliseconds=1)
+
+
+class _ThrottledFileIO(FileIO):
+    """Stand-in for a file on a network filesystem where every non-sequential read pays a round trip."""
+
+    random_read_count = 0
+
+    def readinto(self, buffer: WriteableBuffer, /) -> int | None:
+        if self.tell() != getattr(self, "_next_sequential_position", 0):
+            type(self).random_read_count += 1
+            time.sleep(_LATENCY.total_seconds())
+
+        size = super().readinto(buffer)
+        self._next_sequential_position = self.tell()
+        return size
+
+
+@pytest.fixture(name="wheel_with_shuffled_record_path")
+def wheel_with_shuffled_record_path_fixture(tmp_path: Path) -> Path:
+    files = {f"lib/module_{index}.py": os.urandom(4096) for index in range(200)}
+    return build_wheel(tmp_path, files=files, record_order=[*reversed(files)])
+
+
+def test_read_plan_is_sequential(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    wheel_with_shuffled_record_path: Path,
+) -> None:
+    with (
+        BufferedReader(_ThrottledFileIO(wheel_with_shuffled_record_path)) as file,
+        ZipFile(file) as zip_file,
+    ):
+        # Reading in RECORD order, like a naive conversion would.
+        for file_path in reversed(zip_file.namelist()):
+            zip_file.read(file_path)
+    record_order_random_read_count = _ThrottledFileIO.random_read_count
+
+    monkeypatch.setattr(_read_wheel, "FileIO", _ThrottledFileIO)
+    monkeypatch.setattr(_read_wheel, "_SLURP_MAX_SIZE_IN_BYTES", 0)
+    _ThrottledFileIO.random_read_count = 0
+    python_wheel_to_conda_package(
+        wheel_with_shuffled_record_path, output_directory=tmp_path / "output"
+    )
+    planned_random_read_count = _ThrottledFileIO.random_read_count
+
+    assert planned_random_read_count * 10 < record_order_random_read_count
+
+
+def test_read_strategy_does_not_change_conda_package(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    wheel_with_shuffled_record_path: Path,
+) -> None:
+    slurped_conda_package_path = python_wheel_to_conda_package(
+        wheel_with_shuffled_record_path, output_directory=tmp_path / "slurped"
+    )
+
+    monkeypatch.setattr(_read_wheel, "_SLURP_MAX_SIZE_IN_BYTES", 0)
+    buffered_conda_package_path = python_wheel_to_conda_package(
+        wheel_with_shuffled_record_path, output_directory=tmp_path / "buffered"
+    )
+
+    assert (
+        buffered_conda_package_path.read_bytes()
+        == slurped_conda_package_path.read_bytes()
+    )
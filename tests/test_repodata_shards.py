@@ -0,0 +1,132 @@
+import gzip
+import hashlib
+import json
+import multiprocessing
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from subprocess import PIPE, Popen
+from typing import Any
+
+import pytest
+
+from python_wheel_to_conda_package import (
+    _repodata_shards,
+    python_wheel_to_conda_package,
+)
+from python_wheel_to_conda_package._repodata_shards import update_repodata_shards
+
+from ._build_wheel import build_wheel
+
+
+def _read(path: Path, /) -> Any:  # noqa: ANN401
+    return json.loads(gzip.decompress(path.read_bytes()))
+
+
+def test_repodata_shards(tmp_path: Path, wheel_path: Path) -> None:
+    subdir_directory = tmp_path / "channel" / "noarch"
+    index_path = subdir_directory / "repodata_shards.json.gz"
+
+    conda_package_path = python_wheel_to_conda_package(
+        wheel_path, output_directory=subdir_directory, update_repodata_shards=True
+    )
+    package_name = conda_package_path.name.rsplit("-", 2)[0]
+    shard_sha256 = _read(index_path)["shards"][package_name]
+    shard_path = subdir_directory / "shards" / f"{shard_sha256}.json.gz"
+    shard_modification_time = shard_path.stat().st_mtime_ns
+
+    other_conda_package_path = python_wheel_to_conda_package(
+        build_wheel(tmp_path, files={"lib/__init__.py": b""}),
+        output_directory=subdir_directory,
+        update_repodata_shards=True,
+    )
+
+    shard_index = _read(index_path)
+    assert shard_index["info"]["subdir"] == "noarch"
+    assert shard_index["shards"].keys() == {package_name, "lib"}
+    assert shard_index["shards"][package_name] == shard_sha256
+    assert shard_path.stat().st_mtime_ns == shard_modification_time
+    assert hashlib.sha256(shard_path.read_bytes()).hexdigest() == shard_sha256
+
+    other_shard = _read(
+        subdir_directory / "shards" / f"{shard_index['shards']['lib']}.json.gz"
+    )
+    record = other_shard["packages"][other_conda_package_path.name]
+    assert record["name"] == "lib"
+    assert record["size"] == other_conda_package_path.stat().st_size
+    assert (
+        record["sha256"]
+        == hashlib.sha256(other_conda_package_path.read_bytes()).hexdigest()
+    )
+
+
+def _add_packages(subdir_directory: Path, package_names: list[str], /) -> None:
+    for package_name in package_names:
+        update_repodata_shards(
+            subdir_directory / f"{package_name}-1.0-0.tar.bz2",
+            repodata_record={"name": package_name, "subdir": "noarch"},
+        )
+
+
+def test_repodata_shards_concurrent_updates(tmp_path: Path) -> None:
+    process_count = 4
+    package_names = [
+        [f"package-{process_index}-{index}" for index in range(20)]
+        for process_index in range(process_count)
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=process_count, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        for future in [
+            executor.submit(_add_packages, tmp_path, names) for names in package_names
+        ]:
+            future.result()
+
+    # An update lost by another process holding the lock at the same time would be missing.
+    assert _read(tmp_path / "repodata_shards.json.gz")["shards"].keys() == {
+        package_name for names in package_names for package_name in names
+    }
+
+
+def test_repodata_shards_lock_of_killed_process(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    lock_path = tmp_path / "repodata_shards.lock"
+    holder = Popen(
+        [
+            sys.executable,
+            "-c",
+            f"""
+import time
+from pathlib import Path
+
+from python_wheel_to_conda_package._repodata_shards import _lock
+
+with _lock(Path({str(lock_path)!r})):
+    print("locked", flush=True)
+    time.sleep(60)
+""",
+        ],
+        stdout=PIPE,
+        text=True,
+    )
+
+    try:
+        assert holder.stdout
+        assert holder.stdout.readline() == "locked\n"
+        monkeypatch.setattr(_repodata_shards, "_LOCK_TIMEOUT", timedelta(seconds=0.1))
+
+        with pytest.raises(TimeoutError, match=re.escape(f"`{lock_path}`")):
+            _add_packages(tmp_path, ["waiting"])
+    finally:
+        holder.kill()
+        holder.communicate()
+
+    _add_packages(tmp_path, ["after-kill"])
+
+    assert _read(tmp_path / "repodata_shards.json.gz")["shards"].keys() == {
+        "after-kill"
+    }
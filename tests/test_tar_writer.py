@@ -0,0 +1,63 @@
+import tarfile
+from io import BytesIO
+
+import pytest
+
+from python_wheel_to_conda_package import _tar_writer
+from python_wheel_to_conda_package._tar_writer import TarWriter
+
+_MEMBERS = {
+    "info/index.json": b"{}",
+    "site-packages/lib/__init__.py": b"",
+    "site-packages/lib/data.bin": bytes(range(256)) * 17,
+    "bin/script": b"#!/bin/sh\n",
+    f"bin/{'b' * 120}": b"#!/bin/sh\n",
+    f"site-packages/lib/{'a' * 120}.py": b"long name",
+    "site-packages/lib/café.py": b"non-ASCII name",
+}
+_EXECUTABLE_NAMES = {"bin/script", f"bin/{'b' * 120}"}
+
+
+def _write_with_tarfile() -> bytes:
+    file = BytesIO()
+
+    with tarfile.open(fileobj=file, mode="w") as tar:
+        for name, content in _MEMBERS.items():
+            tar_info = tarfile.TarInfo(name)
+            tar_info.size = len(content)
+            if name in _EXECUTABLE_NAMES:
+                tar_info.mode = 0o755
+            tar.addfile(tar_info, BytesIO(content))
+
+    return file.getvalue()
+
+
+@pytest.mark.parametrize("flush_threshold_in_bytes", [1, 1024 * 1024])
+def test_tar_writer_writes_same_bytes_as_tarfile(
+    flush_threshold_in_bytes: int, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        _tar_writer, "_FLUSH_THRESHOLD_IN_BYTES", flush_threshold_in_bytes
+    )
+    file = BytesIO()
+    tar_writer = TarWriter(file)
+
+    for index, (name, content) in enumerate(_MEMBERS.items()):
+        mode = 0o755 if name in _EXECUTABLE_NAMES else _tar_writer.DEFAULT_MODE
+        if index % 2:
+            tar_writer.add_stream(
+                name, [content[:7], content[7:]], mode=mode, size=len(content)
+            )
+        else:
+            tar_writer.add(name, content, mode=mode)
+
+    tar_writer.close()
+
+    assert file.getvalue() == _write_with_tarfile()
+
+
+def test_tar_writer_rejects_truncated_stream() -> None:
+    tar_writer = TarWriter(BytesIO())
+
+    with pytest.raises(OSError, match="Expected 3 bytes"):
+        tar_writer.add_stream("lib/__init__.py", [b"ab"], size=3)
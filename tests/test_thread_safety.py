@@ -0,0 +1,71 @@
+import gzip
+import json
+import sys
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from python_wheel_to_conda_package import Converter
+
+from ._build_wheel import build_wheel
+
+
+@pytest.fixture(autouse=True)
+def _frequent_thread_switches() -> Generator[None, None, None]:
+    # With the GIL, switching threads more often interleaves the conversions more.
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(switch_interval)
+
+
+def test_concurrent_conversions(tmp_path: Path, wheel_path: Path) -> None:
+    wheel_paths = [
+        wheel_path,
+        *[
+            build_wheel(
+                tmp_path,
+                files={
+                    f"lib_{index}/module_{module_index}.py": f"VALUE = {module_index}\n".encode()
+                    for module_index in range(100)
+                },
+                name=f"lib_{index}",
+            )
+            for index in range(4)
+        ],
+    ]
+    converter = Converter(read_thread_count=2, update_repodata_shards=True)
+    expected_conda_packages = {
+        result.conda_package_path.name: result.conda_package_path.read_bytes()
+        for result in converter.convert_many(
+            wheel_paths, output_directory=tmp_path / "sequential", thread_count=1
+        )
+    }
+
+    # The same Wheels are converted several times to the same directories at the same time.
+    results = converter.convert_many(
+        wheel_paths * 8,
+        output_directory=[tmp_path / "concurrent", tmp_path / "clone"],
+        thread_count=16,
+    )
+
+    for result in results:
+        assert (
+            result.conda_package_path.read_bytes()
+            == (expected_conda_packages[result.conda_package_path.name])
+        )
+
+    for directory in [tmp_path / "concurrent", tmp_path / "clone"]:
+        assert {
+            path.name: path.read_bytes()
+            for path in directory.iterdir()
+            if path.suffix == ".bz2"
+        } == expected_conda_packages
+        assert not [path for path in directory.iterdir() if path.suffix == ".tmp"]
+        shard_index = json.loads(
+            gzip.decompress((directory / "repodata_shards.json.gz").read_bytes())
+        )
+        assert shard_index["shards"].keys() == {
+            result.index["name"] for result in results
+        }
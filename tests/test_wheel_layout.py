@@ -0,0 +1,46 @@
+from pathlib import Path
+from zipfile import ZipFile
+
+from python_wheel_to_conda_package._wheel_dist_info import WheelDistInfo
+from python_wheel_to_conda_package._wheel_layout import WheelLayout
+
+
+def test_wheel_layout(tmp_path: Path) -> None:
+    wheel_path = tmp_path / "lib-1.0-py3-none-any.whl"
+
+    with ZipFile(wheel_path, mode="w") as zip_file:
+        for file_path in [
+            "lib/__init__.py",
+            "lib/not-a.dist-info/file.txt",
+            "lib-1.0.data/scripts/run",
+            "lib-1.0.data/data/share/lib/a.txt",
+            "lib-1.0.data/data/share/lib/b.txt",
+            "lib-1.0.dist-info/licenses/LICENSE",
+        ]:
+            zip_file.writestr(file_path, "")
+
+        zip_file.writestr(
+            "lib-1.0.dist-info/METADATA",
+            "Metadata-Version: 2.1\nName: lib\nVersion: 1.0\n\nLong description: not parsed\n",
+        )
+        zip_file.writestr(
+            "lib-1.0.dist-info/WHEEL",
+            "Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py3-none-any\n",
+        )
+        zip_file.writestr("lib-1.0.dist-info/RECORD", "lib-1.0.dist-info/RECORD,,\n")
+
+    with ZipFile(wheel_path) as zip_file:
+        wheel_layout = WheelLayout.from_zip_file(zip_file)
+
+        assert wheel_layout.dist_info_folder_name == "lib-1.0.dist-info"
+        assert wheel_layout.data_folder_names == {
+            "data": "lib-1.0.data/data",
+            "scripts": "lib-1.0.data/scripts",
+        }
+        assert len(wheel_layout.members) == len(zip_file.namelist())
+
+        wheel_dist_info = WheelDistInfo.read(zip_file, wheel_layout=wheel_layout)
+
+    assert wheel_dist_info.metadata.package_name == "lib"
+    assert wheel_dist_info.metadata.version == "1.0"
+    assert wheel_dist_info.metadata.requires_dist == []
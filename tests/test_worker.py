@@ -0,0 +1,111 @@
+import os
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+from subprocess import Popen, check_call
+
+import pytest
+
+from python_wheel_to_conda_package import _worker
+
+from ._build_wheel import build_wheel
+
+
+def _run_workers(queue_directory: Path, /, *, count: int, lease_duration: int) -> None:
+    command = [
+        sys.executable,
+        "-m",
+        "python_wheel_to_conda_package",
+        "worker",
+        "--queue",
+        str(queue_directory),
+        "--exit-when-empty",
+        "--lease-duration",
+        str(lease_duration),
+        "--poll-interval",
+        "0.01",
+    ]
+
+    if count == 1:
+        check_call(command, timeout=60)
+        return
+
+    processes = [Popen(command) for _ in range(count)]
+
+    for process in processes:
+        assert process.wait(timeout=60) == 0
+
+
+def test_workers_share_queue(tmp_path: Path) -> None:
+    queue_directory = tmp_path / "queue"
+    pending_directory = queue_directory / "pending"
+    pending_directory.mkdir(parents=True)
+
+    wheel_names = {
+        build_wheel(
+            pending_directory,
+            files={f"lib_{index}/__init__.py": b""},
+            name=f"lib{index}",
+        ).name
+        for index in range(12)
+    }
+    (pending_directory / "broken-1.0-py3-none-any.whl").write_text("Not a zip file.")
+
+    _run_workers(queue_directory, count=3, lease_duration=60)
+
+    assert not any(pending_directory.iterdir())
+    assert not any((queue_directory / "claimed").iterdir())
+    assert {path.name for path in (queue_directory / "done").iterdir()} == wheel_names
+    assert {path.name for path in (queue_directory / "output").iterdir()} == {
+        f"lib{index}-1.0-py_0.tar.bz2" for index in range(12)
+    }
+    assert {path.name for path in (queue_directory / "failed").iterdir()} == {
+        "broken-1.0-py3-none-any.whl",
+        "broken-1.0-py3-none-any.whl.error",
+    }
+
+
+def test_expired_claim_is_stolen(tmp_path: Path) -> None:
+    queue_directory = tmp_path / "queue"
+    claim_directory = queue_directory / "claimed" / "crashed-worker"
+    claim_directory.mkdir(parents=True)
+    wheel_path = build_wheel(claim_directory, files={"lib/__init__.py": b""})
+    an_hour_ago = time.time() - 3600
+    os.utime(claim_directory, (an_hour_ago, an_hour_ago))
+
+    _run_workers(queue_directory, count=1, lease_duration=60)
+
+    assert not any((queue_directory / "claimed").iterdir())
+    assert (queue_directory / "done" / wheel_path.name).is_file()
+    assert (queue_directory / "output" / "lib-1.0-py_0.tar.bz2").is_file()
+
+
+def test_expired_claim_stolen_by_another_worker(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    queue_directory = tmp_path / "queue"
+    claimed_directory = queue_directory / "claimed"
+    claim_directory = claimed_directory / "crashed-worker"
+    claim_directory.mkdir(parents=True)
+    build_wheel(claim_directory, files={"lib/__init__.py": b""})
+    an_hour_ago = time.time() - 3600
+    os.utime(claim_directory, (an_hour_ago, an_hour_ago))
+
+    rename = Path.rename
+
+    def rename_and_get_stolen(self: Path, target: Path) -> Path:
+        renamed_path = rename(self, target)
+        # Another worker steals the claim before this one renews its lease.
+        rename(renamed_path, claimed_directory / "other-worker")
+        return renamed_path
+
+    monkeypatch.setattr(Path, "rename", rename_and_get_stolen)
+
+    assert (
+        _worker._steal_expired_claim(  # noqa: SLF001
+            queue_directory, lease_duration=timedelta(minutes=1)
+        )
+        is None
+    )
+    assert [path.name for path in claimed_directory.iterdir()] == ["other-worker"]